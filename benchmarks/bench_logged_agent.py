@@ -0,0 +1,58 @@
+"""Measure the per-call dispatch cost of LoggedAgent methods.
+
+Times `get_settings_path` on a plain agency_swarm `Agent` and on a
+`LoggedAgent` whose logger has INFO enabled and disabled. Records go to a
+`NullHandler`, so only the cost of the instrumentation is measured. Metrics
+recording is off unless `--metrics` is given. Run it on two revisions to
+compare them:
+
+    python benchmarks/bench_logged_agent.py --number 100000
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import timeit
+
+from agency_swarm.agents.agent import Agent
+
+from swarmbasecore.agency_swarm_framework.swarmy_agent import LoggedAgent
+from swarmbasecore.metrics import enable_metrics
+
+
+def per_call_us(method, number: int) -> float:
+    return min(timeit.repeat(method, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument(
+        "--metrics", action="store_true", help="record call metrics as well"
+    )
+    args = parser.parse_args()
+    if args.metrics:
+        enable_metrics()
+
+    os.chdir(tempfile.mkdtemp())
+    plain = Agent(name="Plain", description="Benchmark agent")
+    logged = LoggedAgent(name="Logged", description="Benchmark agent")
+    for handler in logged.logger.handlers[:]:
+        logged.logger.removeHandler(handler)
+    logged.logger.addHandler(logging.NullHandler())
+    logged.logger.propagate = False
+
+    logged.logger.setLevel(logging.INFO)
+    enabled = per_call_us(logged.get_settings_path, args.number)
+    logged.logger.setLevel(logging.WARNING)
+    disabled = per_call_us(logged.get_settings_path, args.number)
+    baseline = per_call_us(plain.get_settings_path, args.number)
+
+    print(f"LoggedAgent, INFO enabled:  {enabled:.2f} us/call")
+    print(f"LoggedAgent, INFO disabled: {disabled:.2f} us/call")
+    print(f"plain Agent:                {baseline:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,28 @@
-"""Imports for swarmbasecore module."""
+"""Imports for swarmbasecore module.
 
-from .builders import AgentBuilder, FrameworkBuilder, SwarmBuilder, ToolBuilder
-from .agency_swarm_framework import swarmy_agency, swarmy_agent, swarmy_tool
+The public names are loaded on first access, so that importing a light
+submodule such as `swarmbasecore.clients` or `swarmbasecore.agency_chart` does
+not pull in agency_swarm, openai and their dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agency_swarm_framework import swarmy_agency, swarmy_agent, swarmy_tool
+    from .builders import AgentBuilder, FrameworkBuilder, SwarmBuilder, ToolBuilder
+
+# Maps each public name to the module it is loaded from, and the attribute of
+# that module, or None for the module itself
+_LAZY_ATTRIBUTES = {
+    "AgentBuilder": (".builders", "AgentBuilder"),
+    "FrameworkBuilder": (".builders", "FrameworkBuilder"),
+    "SwarmBuilder": (".builders", "SwarmBuilder"),
+    "ToolBuilder": (".builders", "ToolBuilder"),
+    "swarmy_agency": (".agency_swarm_framework.swarmy_agency", None),
+    "swarmy_agent": (".agency_swarm_framework.swarmy_agent", None),
+    "swarmy_tool": (".agency_swarm_framework.swarmy_tool", None),
+}
 
 __all__ = [
     "AgentBuilder",
@@ -12,3 +33,18 @@ __all__ = [
     "swarmy_agent",
     "swarmy_tool",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,8 +9,13 @@ Key Features:
 - Add and manage directed and bidirectional relationships between agents.
 - Remove agents and their associated relationships from the graph.
 - Check connectivity between agents and find paths in the graph.
+- Find shortest paths iteratively, including many targets in one traversal.
 - Identify top-level agents without incoming edges.
 
+Internally, the chart keeps a reverse (incoming) adjacency index next to the
+forward graph, so removing an agent costs O(degree) and the top-level agent
+is tracked incrementally instead of being recomputed on every lookup.
+
 Usage:
 To use the AgencyChart class, create an instance and utilize its methods to manage 
 agent relationships as needed.
@@ -25,8 +30,8 @@ Example:
     chart.add_relationship(relationship)
 """
 
-from collections import defaultdict
-from typing import Union, Annotated, Set
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Optional, Union, Annotated, Set
 from .utils import AgentRelationship, RelationshipType
 
 
@@ -35,6 +40,9 @@ class AgencyChart:
 
     def __init__(self):
         self.graph: defaultdict[str, Set[str]] = defaultdict(set)
+        self._incoming: defaultdict[str, Set[str]] = defaultdict(set)
+        # Sources in the graph without incoming edges
+        self._roots: Set[str] = set()
 
     def add_relationship(self, relationship: AgentRelationship):
         """Add a directed relationship from source to target.
@@ -63,7 +71,11 @@ class AgencyChart:
         target: Annotated[str, "agent_id"],
     ):
         """Add a single directed relationship from source to target"""
+        if source not in self.graph and not self._incoming.get(source):
+            self._roots.add(source)
         self.graph[source].add(target)
+        self._incoming[target].add(source)
+        self._roots.discard(target)
 
     def _add_bidirectional(
         self,
@@ -77,12 +89,23 @@ class AgencyChart:
     def remove_agent(self, agent: Annotated[str, "agent_id"]):
         """Remove an agent and all its associated relationships"""
         # Remove all edges where agent is the source
-        if agent in self.graph:
-            del self.graph[agent]
+        for target in self.graph.pop(agent, ()):
+            sources = self._incoming[target]
+            sources.discard(agent)
+            if not sources:
+                del self._incoming[target]
+                if target in self.graph:
+                    self._roots.add(target)
 
         # Remove all edges where agent is the target
-        for targets in self.graph.values():
-            targets.discard(agent)
+        for source in self._incoming.pop(agent, ()):
+            self.graph[source].discard(agent)
+
+        self._roots.discard(agent)
+
+    def in_degree(self, agent: Annotated[str, "agent_id"]) -> int:
+        """Return the number of agents with an edge pointing to the agent"""
+        return len(self._incoming.get(agent, ()))
 
     def is_connected(
         self,
@@ -98,7 +121,10 @@ class AgencyChart:
         target: Annotated[str, "agent_id"],
         path=[],
     ):
-        """Find a path from source to target (may not be the shortest)"""
+        """Find a path from source to target (may not be the shortest).
+
+        This is a recursive search; use `shortest_path` on deep charts.
+        """
         path = path + [source]
         if source == target:
             return path
@@ -111,19 +137,61 @@ class AgencyChart:
                     return new_path
         return None
 
+    def shortest_path(
+        self,
+        source: Annotated[str, "agent_id"],
+        target: Annotated[str, "agent_id"],
+    ) -> Optional[List[str]]:
+        """Find the shortest path from source to target using iterative BFS"""
+        return self.paths_from(source, [target])[target]
+
+    def paths_from(
+        self,
+        source: Annotated[str, "agent_id"],
+        targets: Iterable[Annotated[str, "agent_id"]],
+    ) -> Dict[str, Optional[List[str]]]:
+        """Find the shortest paths from source to each of the targets.
+
+        All targets are answered with a single breadth-first traversal, which
+        stops as soon as every target has been reached.
+
+        Returns:
+            dict: Maps each target to its path, or None if it is unreachable.
+        """
+        targets = list(targets)
+        remaining = set(targets)
+        remaining.discard(source)
+        parents: Dict[str, Optional[str]] = {source: None}
+        queue = deque([source])
+        while queue and remaining:
+            node = queue.popleft()
+            for neighbour in self.graph.get(node, ()):
+                if neighbour not in parents:
+                    parents[neighbour] = node
+                    remaining.discard(neighbour)
+                    queue.append(neighbour)
+
+        paths: Dict[str, Optional[List[str]]] = {}
+        for target in targets:
+            if target not in parents:
+                paths[target] = None
+                continue
+            path = []
+            step: Optional[str] = target
+            while step is not None:
+                path.append(step)
+                step = parents[step]
+            paths[target] = path[::-1]
+        return paths
+
     @property
     def manager_agent(self) -> Union[Annotated[str, "agent_id"], None]:
-        """Find all agents that do not have any incoming edges."""
-        targets = set()
-        for target_set in self.graph.values():
-            targets.update(target_set)
-
-        no_incoming_edges = [agent for agent in self.graph if agent not in targets]
-        if len(no_incoming_edges) > 1:
+        """Find the agent that does not have any incoming edges."""
+        if len(self._roots) > 1:
             raise Exception("Swarm cannot contain multiple top-level agents.")
-        if not no_incoming_edges:
+        if not self._roots:
             return None
-        return no_incoming_edges.pop()
+        return next(iter(self._roots))
 
     def __str__(self):
         return f"{self.__class__.__name__}({dict(self.graph)})"
@@ -1,3 +1,6 @@
+from .agency_pool import AgencyPool, PoolExhausted
+from .process_pool import configure_process_pool, shutdown_process_pool
 from .swarmy_agency import SwarmyAgency
 from .swarmy_agent import LoggedAgent
-from .swarmy_tool import LoggedBaseTool
+from .swarmy_tool import LoggedBaseTool, ToolTimeout, cancellation_requested
+from .tool_executor import ToolExecutor
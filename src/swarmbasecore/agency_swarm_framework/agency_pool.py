@@ -0,0 +1,296 @@
+"""swarmbasecore.agency_swarm_framework.agency_pool
+
+This module provides a pool of pre-warmed agency instances for serving
+concurrent users.
+
+A single agency instance holds the agents and conversation threads of one
+conversation at a time, so serving every user from one instance serializes
+them. `AgencyPool` builds `size` instances from the same factory up front and
+checks one out per request; requests wait in a bounded queue while every
+instance is busy. The instances are built one after another, since building
+an agency creates or updates its OpenAI assistants and rewrites
+settings.json.
+
+Conversations are kept per session rather than per instance: when a request
+for a session checks out an instance, the OpenAI thread ids of the session are
+loaded into it, and the updated ids are saved back when it is returned. Any
+instance can therefore serve any session, and no conversation leaks between
+users. Requests of the same session are served one at a time, so that each one
+continues the conversation left by the previous one.
+
+Key Classes:
+- AgencyPool: Pool of agency instances with per-session conversations, and a
+  FastAPI server through `serve_agency`.
+
+Example:
+    from swarmbasecore.agency_swarm_framework import AgencyPool
+
+    pool = AgencyPool(create_my_swarm, size=4, max_waiting=32)
+    response = pool.get_completion("Hello", session_id="user-1")
+
+    with pool.session("user-1") as agency:
+        agency.get_completion("And again")
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agency_swarm import Agency
+
+ThreadIds = Dict[str, Any]
+
+
+def get_thread_ids(agency: Agency) -> ThreadIds:
+    """Return the OpenAI thread ids of the agency's conversation threads."""
+    thread_ids: ThreadIds = {"main_thread": agency.main_thread.id}
+    for agent_name, threads in agency.agents_and_threads.items():
+        if agent_name == "main_thread":
+            continue
+        thread_ids[agent_name] = {
+            other_agent: thread.id for other_agent, thread in threads.items()
+        }
+    return thread_ids
+
+
+def load_thread_ids(agency: Agency, thread_ids: ThreadIds) -> None:
+    """Point the agency's conversation threads at `thread_ids`.
+
+    Threads missing from `thread_ids` start a new conversation on first use.
+    """
+    for thread, thread_id in _threads_with_ids(agency, thread_ids):
+        thread.id = thread_id
+        thread._thread = None
+        thread._run = None
+        thread._stream = None
+
+
+def _threads_with_ids(agency: Agency, thread_ids: ThreadIds):
+    yield agency.main_thread, thread_ids.get("main_thread")
+    for agent_name, threads in agency.agents_and_threads.items():
+        if agent_name == "main_thread":
+            continue
+        agent_thread_ids = thread_ids.get(agent_name) or {}
+        for other_agent, thread in threads.items():
+            yield thread, agent_thread_ids.get(other_agent)
+
+
+class PoolExhausted(Exception):
+    """Raised when no agency instance can be checked out."""
+
+
+class AgencyPool:
+    """Pool of agency instances created from the same factory.
+
+    Args:
+        factory (Callable[[], Agency]): Creates one agency instance.
+        size (int): Number of instances, all created up front.
+        max_waiting (Optional[int]): Maximum number of requests waiting for an
+            instance; further requests are rejected. Unbounded if None.
+        max_sessions (int): Maximum number of sessions whose conversations are
+            remembered; the least recently used session is forgotten first.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Agency],
+        size: int = 4,
+        max_waiting: Optional[int] = None,
+        max_sessions: int = 10000,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_waiting = max_waiting
+        self.max_sessions = max_sessions
+
+        self.agencies: List[Agency] = [factory() for _ in range(size)]
+
+        self._idle = list(self.agencies)
+        self._waiting = 0
+        self._condition = threading.Condition()
+        self._sessions: "OrderedDict[str, ThreadIds]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        # Lock of each session in use, with the number of requests holding it
+        # or waiting for it
+        self._session_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+
+    def acquire(self, timeout: Optional[float] = None) -> Agency:
+        """Check out an idle instance, waiting up to `timeout` seconds.
+
+        Raises:
+            PoolExhausted: If `max_waiting` requests are already waiting, or
+                if no instance became idle within `timeout`.
+        """
+        with self._condition:
+            if not self._idle:
+                if self.max_waiting is not None and self._waiting >= self.max_waiting:
+                    raise PoolExhausted("Too many requests are waiting for an agency.")
+                self._waiting += 1
+                try:
+                    if not self._condition.wait_for(lambda: self._idle, timeout):
+                        raise PoolExhausted(
+                            f"No agency became available within {timeout} seconds.",
+                        )
+                finally:
+                    self._waiting -= 1
+            return self._idle.pop()
+
+    def release(self, agency: Agency) -> None:
+        with self._condition:
+            self._idle.append(agency)
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Agency]:
+        """Check out an instance for the duration of the block."""
+        agency = self.acquire(timeout)
+        try:
+            yield agency
+        finally:
+            self.release(agency)
+
+    @contextmanager
+    def _lock_session(
+        self,
+        session_id: str,
+        timeout: Optional[float],
+    ) -> Iterator[None]:
+        with self._sessions_lock:
+            lock, users = self._session_locks.get(session_id, (threading.Lock(), 0))
+            self._session_locks[session_id] = (lock, users + 1)
+        try:
+            if not lock.acquire(timeout=-1 if timeout is None else timeout):
+                raise PoolExhausted(
+                    f"Session {session_id} stayed busy for {timeout} seconds.",
+                )
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            with self._sessions_lock:
+                lock, users = self._session_locks.pop(session_id)
+                if users > 1:
+                    self._session_locks[session_id] = (lock, users - 1)
+
+    @contextmanager
+    def session(
+        self,
+        session_id: str,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Agency]:
+        """Check out an instance holding the conversation of `session_id`.
+
+        Raises:
+            PoolExhausted: If no instance can be checked out, or if another
+                request of the session is still running after `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock_session(session_id, timeout):
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0.0)
+            with self.checkout(timeout) as agency:
+                with self._sessions_lock:
+                    thread_ids = self._sessions.get(session_id, {})
+                load_thread_ids(agency, thread_ids)
+                try:
+                    yield agency
+                finally:
+                    thread_ids = get_thread_ids(agency)
+                    with self._sessions_lock:
+                        self._sessions[session_id] = thread_ids
+                        self._sessions.move_to_end(session_id)
+                        while len(self._sessions) > self.max_sessions:
+                            self._sessions.popitem(last=False)
+
+    def get_completion(
+        self,
+        message: str,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> str:
+        """Send `message` within `session_id`, or a new session if None."""
+        with self.session(session_id or uuid.uuid4().hex, timeout) as agency:
+            return agency.get_completion(message, **kwargs)
+
+    @property
+    def idle(self) -> int:
+        """Number of instances currently checked in."""
+        return len(self._idle)
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests currently waiting for an instance."""
+        return self._waiting
+
+    def serve_agency(
+        self,
+        origins: List[str],
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        timeout: Optional[float] = 30.0,
+    ) -> None:
+        """Serve the pool with FastAPI at POST /get_completion.
+
+        The request body holds `message` and optionally `session_id`,
+        `recipient_agent` and `additional_instructions`. Requests that cannot
+        get an instance in time are answered with 503.
+        """
+        import uvicorn
+        from fastapi import FastAPI, HTTPException
+        from fastapi.concurrency import run_in_threadpool
+        from fastapi.middleware.cors import CORSMiddleware
+        from pydantic import BaseModel
+
+        class CompletionRequest(BaseModel):
+            message: str
+            session_id: Optional[str] = None
+            recipient_agent: Optional[str] = None
+            additional_instructions: Optional[str] = None
+
+        def complete(request: CompletionRequest) -> Dict[str, str]:
+            session_id = request.session_id or uuid.uuid4().hex
+            try:
+                with self.session(session_id, timeout) as agency:
+                    recipient_agent = None
+                    if request.recipient_agent is not None:
+                        recipient_agent = next(
+                            (
+                                agent
+                                for agent in agency.agents
+                                if agent.name == request.recipient_agent
+                            ),
+                            None,
+                        )
+                        if recipient_agent is None:
+                            raise HTTPException(
+                                status_code=422,
+                                detail=f"Unknown agent {request.recipient_agent}.",
+                            )
+                    response = agency.get_completion(
+                        request.message,
+                        recipient_agent=recipient_agent,
+                        additional_instructions=request.additional_instructions,
+                    )
+            except PoolExhausted as e:
+                raise HTTPException(status_code=503, detail=str(e)) from e
+            return {"response": response, "session_id": session_id}
+
+        app = FastAPI()
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+        @app.post("/get_completion")
+        async def get_completion(request: CompletionRequest):
+            return await run_in_threadpool(complete, request)
+
+        uvicorn.run(app, host=host, port=port)
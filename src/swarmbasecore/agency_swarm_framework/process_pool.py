@@ -0,0 +1,132 @@
+"""swarmbasecore.agency_swarm_framework.process_pool
+
+This module runs CPU-heavy tools in a warm pool of worker processes, so that a
+tool holding the GIL does not stall the other conversations served by the
+same process.
+
+A `LoggedBaseTool` subclass opts in with `run_in_process = True`. Its `run`
+is then executed in a worker process: only the tool's import path and its
+validated field values are sent across, the worker rebuilds the tool without
+validating it again and calls the undecorated `run`, and the result is sent
+back. Logging, metrics, memoization and timeouts stay in the calling process.
+
+Tools that cannot be imported by name (for example classes defined inside a
+function) are run inline.
+
+Key Functions:
+- configure_process_pool: Set the number of worker processes and start them.
+- shutdown_process_pool: Stop the worker processes.
+
+Example:
+    from swarmbasecore.agency_swarm_framework import configure_process_pool
+
+    configure_process_pool(max_workers=4)
+"""
+
+import atexit
+import importlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import wraps
+from typing import Any, Dict, Optional
+
+_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_max_workers: Optional[int] = None
+
+
+def _noop() -> None:
+    return None
+
+
+def configure_process_pool(max_workers: Optional[int] = None) -> None:
+    """Start the worker processes, replacing a pool of a different size.
+
+    Args:
+        max_workers (Optional[int]): Number of worker processes, the number of
+            CPUs if None.
+    """
+    global _pool, _max_workers
+    with _lock:
+        if _pool is not None and max_workers == _max_workers:
+            return
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _max_workers = max_workers
+        _pool = ProcessPoolExecutor(max_workers=max_workers)
+        # Start every worker now rather than on the first tool call
+        for _ in range(max_workers or os.cpu_count() or 1):
+            _pool.submit(_noop)
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    pool = _pool
+    # Another thread may shut the new pool down before it is read
+    while pool is None:
+        configure_process_pool(_max_workers)
+        pool = _pool
+    return pool
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+
+
+def _run_tool(module: str, qualname: str, fields: Dict[str, Any]) -> Any:
+    """Rebuild the tool in the worker process and call its undecorated `run`."""
+    tool_class: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        tool_class = getattr(tool_class, name)
+    tool = tool_class.model_construct(**fields)
+    return tool_class._undecorated_run(tool)
+
+
+def _importable(tool_class: type) -> bool:
+    return "<locals>" not in tool_class.__qualname__ and tool_class.__module__ != "__main__"
+
+
+def run_in_process(func):
+    """Decorator running `run` in the worker process pool.
+
+    It only applies when the tool class sets `run_in_process` and can be
+    imported by name; otherwise `run` is called inline.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tool_class = self.__class__
+        if not self.run_in_process or args or kwargs or not _importable(tool_class):
+            return func(self, *args, **kwargs)
+
+        fields = {name: getattr(self, name) for name in tool_class.model_fields}
+        pool = _get_pool()
+        try:
+            future = pool.submit(
+                _run_tool,
+                tool_class.__module__,
+                tool_class.__qualname__,
+                fields,
+            )
+            return future.result()
+        except BrokenProcessPool:
+            # A worker died, e.g. killed by the OS; start a new pool next time
+            _discard_broken_pool(pool)
+            raise
+
+    return wrapper
@@ -1,15 +1,95 @@
 """swarmbasecore.agency_swarm_framework.swarmy_agency
 
-This module defines the SwarmyAgency class, which extends the Agency class 
-from the agency_swarm module. The SwarmyAgency class should serve as a wrapper 
+This module defines the SwarmyAgency class, which extends the Agency class
+from the agency_swarm module. The SwarmyAgency class should serve as a wrapper
 for logging.
-# TODO
+
+Key Classes:
+- SwarmyAgency: Inherits from Agency. When created with `tool_workers`, the
+  independent tool calls of each agent turn run concurrently on a shared
+  thread pool of that size (see `tool_executor`). When created with
+  `tool_processes`, the worker processes of tools that set `run_in_process`
+  are started up front (see `process_pool`). When created with
+  `lazy_agents=True`, the OpenAI assistants of its `LoggedAgent`s are only
+  initialized the first time a message is routed to them; with
+  `settings_callbacks`, the settings are saved again after each of them. The
+  construction time is logged, kept in `startup_seconds` and, when metrics
+  are enabled, recorded in `swarmbasecore.metrics.metrics`.
+
 """
 
+import json
+import time
+from typing import Optional
+
 from agency_swarm import Agency
 
+from ..logging_utils import setup_logger
+from ..metrics import metrics
+from .process_pool import configure_process_pool
+from .swarmy_agent import LoggedAgent
+from .tool_executor import ToolExecutor, enable_concurrent_tool_calls
+
 
 class SwarmyAgency(Agency):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        tool_workers: Optional[int] = None,
+        tool_processes: Optional[int] = None,
+        lazy_agents: bool = False,
+        **kwargs,
+    ):
+        start = time.perf_counter()
+        self.logger = setup_logger(self.__class__.__name__, kwargs.get("name"))
+        self.lazy_agents = lazy_agents
+        self.tool_executor = ToolExecutor(tool_workers) if tool_workers else None
+        if tool_processes:
+            configure_process_pool(tool_processes)
         super().__init__(*args, **kwargs)
+
+        self.startup_seconds = time.perf_counter() - start
+        if metrics.enabled:
+            metrics.observe(
+                "agency",
+                self.__class__.__name__,
+                "__init__",
+                self.startup_seconds,
+            )
+        self.logger.info(
+            "Started %s with %d agents in %.3fs (%d initialized)",
+            self.__class__.__name__,
+            len(self.agents),
+            self.startup_seconds,
+            sum(
+                not isinstance(agent, LoggedAgent) or agent.materialized
+                for agent in self.agents
+            ),
+        )
+
+    def _init_agents(self):
+        if self.lazy_agents:
+            for agent in self.agents:
+                if isinstance(agent, LoggedAgent):
+                    agent.defer_init_oai(
+                        self._save_settings if self.settings_callbacks else None
+                    )
+        super()._init_agents()
+
+    def _save_settings(self, agent: LoggedAgent):
+        """Pass the settings file to the `save` settings callback."""
+        with open(agent.get_settings_path(), "r") as f:
+            settings = json.load(f)
+        self.settings_callbacks["save"](settings)
+
+    def _init_threads(self):
+        super()._init_threads()
+        if self.tool_executor is None:
+            return
+        enable_concurrent_tool_calls(self.main_thread, self.tool_executor)
+        for agent_name, threads in self.agents_and_threads.items():
+            if agent_name == "main_thread":
+                continue
+            for thread in threads.values():
+                enable_concurrent_tool_calls(thread, self.tool_executor)
@@ -1,55 +1,167 @@
+"""
+swarmbasecore.agency_swarm_framework.swarmy_agent
+
+This module provides the LoggedAgent class, which extends the agency_swarm
+Agent class to log every call of its public methods.
+
+Key Classes:
+- LoggedAgent: Inherits from Agent. Its public methods, and those of its
+  subclasses, are instrumented once per class when the class is created, so
+  calls are logged through the agent's own logger without any per-access
+  wrapping. When the logger does not emit INFO records, the instrumented
+  method only performs a level check before calling the original method.
+  When metrics are enabled, call counts, error counts and latencies are
+  recorded per class and method in `swarmbasecore.metrics.metrics`.
+
+  After `defer_init_oai` is called, `init_oai` only marks the agent as
+  pending, and the OpenAI assistant is loaded, created or updated by
+  `materialize` the first time the agent's `id` is read, which happens when a
+  run is started for it. Materialization is serialized across all agents,
+  since `init_oai` reads and rewrites the shared settings file.
+
+"""
+
+import inspect
+import logging
+import threading
+import time
 from functools import wraps
+from typing import Callable, Optional
 
 from agency_swarm.agents.agent import Agent
 
 from ..logging_utils import setup_logger
+from ..metrics import metrics
 
+# Serializes deferred `init_oai` calls of all agents: they read and rewrite the
+# same settings file, and agents of the same name in different agencies must
+# not each create an assistant.
+_materialize_lock = threading.RLock()
+
+
+def logged_method(func):
+    """Log calls of a method through the `logger` attribute of its instance.
+
+    When metrics are enabled, the call is also recorded in
+    `swarmbasecore.metrics.metrics`.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        logger = getattr(self, "logger", None)
+        log = logger is not None and logger.isEnabledFor(logging.INFO)
+        if not log and not metrics.enabled:
+            return func(self, *args, **kwargs)
+
+        if log:
+            logger.info("Calling %s", func.__name__)
+        start = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except Exception as e:
+            if metrics.enabled:
+                metrics.observe(
+                    "agent",
+                    self.__class__.__name__,
+                    func.__name__,
+                    time.perf_counter() - start,
+                    error=True,
+                )
+            if logger is not None:
+                logger.error("Error in %s: %s", func.__name__, e)
+            raise
+        if metrics.enabled:
+            metrics.observe(
+                "agent",
+                self.__class__.__name__,
+                func.__name__,
+                time.perf_counter() - start,
+            )
+        if log:
+            logger.info("%s completed successfully", func.__name__)
+        return result
+
+    wrapper.__logged__ = True
+    return wrapper
 
-def log_method(logger):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            logger.info(f"Calling {func.__name__}")
-            try:
-                result = func(*args, **kwargs)
-                logger.info(f"{func.__name__} completed successfully")
-                return result
-            except Exception as e:
-                logger.error(f"Error in {func.__name__}: {e!s}")
-                raise
 
-        return wrapper
+def instrument_class(cls):
+    """Wrap the public methods of `cls` and its bases with `logged_method`.
 
-    return decorator
+    Methods that are already instrumented, as well as properties, class
+    methods and static methods, are left untouched.
+    """
+    for attr_name in dir(cls):
+        if attr_name.startswith("_"):
+            continue
+        attr = inspect.getattr_static(cls, attr_name)
+        if inspect.isfunction(attr) and not getattr(attr, "__logged__", False):
+            setattr(cls, attr_name, logged_method(attr))
+    return cls
 
 
 class LoggedAgent(Agent):
     def __init__(self, *args, **kwargs):
         self.name = kwargs.get("name", "agent")
         self.logger = setup_logger(self.__class__.__name__, self.name)
+        self._defer_init_oai = False
+        self._init_oai_pending = False
+        self._materializing = False
+        self._on_materialize: Optional[Callable[["LoggedAgent"], None]] = None
         super().__init__(*args, **kwargs)
-        self._wrap_methods()
-
-    def _wrap_methods(self):
-        for attr_name in dir(self):
-            if not attr_name.startswith("_") and attr_name != "assistant":
-                try:
-                    attr = super().__getattribute__(attr_name)
-                    if callable(attr) and not isinstance(attr, property):
-                        setattr(self, attr_name, log_method(self.logger)(attr))
-                except Exception:
-                    self.logger.exception(
-                        "Attribure '%s' can't be accessed.",
-                        attr_name,
-                    )
-
-    def __getattribute__(self, name):
-        attr = super().__getattribute__(name)
-        if (
-            name != "assistant"
-            and callable(attr)
-            and not name.startswith("_")
-            and not isinstance(attr, property)
-        ):
-            return log_method(self.logger)(attr)
-        return attr
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+
+    @property
+    def id(self):
+        if self.__dict__.get("_init_oai_pending"):
+            self.materialize()
+        return self.__dict__.get("_id")
+
+    @id.setter
+    def id(self, value):
+        self.__dict__["_id"] = value
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the agent's OpenAI assistant has been initialized."""
+        return not self._init_oai_pending
+
+    def defer_init_oai(
+        self, on_materialize: Optional[Callable[["LoggedAgent"], None]] = None
+    ):
+        """Postpone the OpenAI assistant initialization until first use.
+
+        Args:
+            on_materialize (Optional[Callable[[LoggedAgent], None]]): Called
+                with the agent after its deferred initialization, while the
+                settings file is still locked.
+        """
+        self._defer_init_oai = True
+        self._on_materialize = on_materialize
+
+    def init_oai(self):
+        if self._defer_init_oai:
+            self._init_oai_pending = True
+            return self
+        return super().init_oai()
+
+    def materialize(self):
+        """Initialize the OpenAI assistant now if it was deferred."""
+        with _materialize_lock:
+            if not self._init_oai_pending or self._materializing:
+                return self
+            self._materializing = True
+            try:
+                super().init_oai()
+                self._init_oai_pending = False
+                if self._on_materialize is not None:
+                    self._on_materialize(self)
+            finally:
+                self._materializing = False
+        return self
+
+
+instrument_class(LoggedAgent)
@@ -13,49 +13,432 @@ Key Classes:
 Usage:
 To create a subclass of LoggedBaseTool, simply inherit from it and define 
 your methods. The `run` method will be automatically wrapped with logging 
-functionality.
+functionality. Set `log_max_field_length` and `log_max_result_length` on the 
+subclass to change how much of each field and of the result is logged 
+(`None` disables truncation). When metrics are enabled, call counts, error 
+counts and latencies of `run` are recorded per class in 
+`swarmbasecore.metrics.metrics`.
+
+Tools whose result only depends on their fields can set `cache_results = True` 
+to memoize `run`, keyed on a hash of the field values. `cache_maxsize` and 
+`cache_ttl` bound the in-memory cache, and `cache_dir` adds an on-disk layer. 
+`cache_info()` returns the hit and miss counters. Each call receives its own 
+copy of a cached result, and iterators and generators are never cached.
+
+Tools can set `run_timeout` to a number of seconds to bound `run`. The call 
+then runs on a worker thread; if it does not finish in time, the worker is 
+abandoned, asked to stop through `cancellation_requested()`, and `run` 
+returns a `ToolTimeout` instead, which the agent receives as a JSON error.
+`max_concurrency` caps how many calls of the tool run at once when the agency 
+executes tool calls concurrently. CPU-heavy tools can set 
+`run_in_process = True` to run in a warm pool of worker processes (see 
+`process_pool`).
 
 """
 
+import contextvars
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import reprlib
+import threading
+import time
+import uuid
 from abc import ABC
+from collections.abc import Iterator
 from functools import wraps
+from pathlib import Path
+from dataclasses import asdict, dataclass
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 from agency_swarm.tools.BaseTool import BaseTool
 
 from ..logging_utils import setup_logger
+from ..metrics import metrics
+from ..utils import TTLCache
+from .process_pool import run_in_process
+
+
+def truncate(value: Any, limit: Optional[int]) -> str:
+    """Render a value for logging, capped at `limit` characters.
+
+    Strings are sliced, other values are rendered with `reprlib`, so the work
+    done is bounded by the limit rather than by the size of the value.
+    """
+    if limit is None:
+        return str(value)
+    if isinstance(value, str):
+        text = value
+    else:
+        bounded_repr = reprlib.Repr()
+        bounded_repr.maxstring = bounded_repr.maxother = max(limit, 3)
+        text = bounded_repr.repr(value)
+    if len(text) > limit:
+        return f"{text[:limit]}... [{len(text) - limit} more characters]"
+    return text
+
+
+class LazyFields:
+    """Tool fields rendered only when the log record is formatted."""
+
+    __slots__ = ("fields", "limit")
+
+    def __init__(self, fields: Dict[str, Any], limit: Optional[int]):
+        self.fields = fields
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name}={truncate(value, self.limit)}"
+            for name, value in self.fields.items()
+        )
+
+
+class LazyValue:
+    """A value rendered, truncated, only when the log record is formatted."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: Optional[int]):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return truncate(self.value, self.limit)
 
 
 def log_execution(logger, func):
     """Decorator for logging the execution of the `run` method.
     Logs the method name, arguments, and the result.
+
+    Records are built only when the logger emits them. Field values and the
+    result are formatted lazily and truncated to the tool class's
+    `log_max_field_length` and `log_max_result_length`, and are also attached
+    unformatted to the record as `tool`, `tool_fields` and `tool_result`.
+
+    When metrics are enabled, every call is also recorded in
+    `swarmbasecore.metrics.metrics`.
     """
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
+        if not metrics.enabled:
+            return _logged_call(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            result = _logged_call(self, *args, **kwargs)
+        except Exception:
+            metrics.observe(
+                "tool",
+                self.__class__.__name__,
+                func.__name__,
+                time.perf_counter() - start,
+                error=True,
+            )
+            raise
+        metrics.observe(
+            "tool",
+            self.__class__.__name__,
+            func.__name__,
+            time.perf_counter() - start,
+            error=isinstance(result, ToolTimeout),
+        )
+        return result
+
+    def _logged_call(self, *args, **kwargs):
+        if not logger.isEnabledFor(logging.INFO):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                _log_error(logger, func, self, e)
+                raise
+
+        tool = self.__class__.__name__
+        fields = LazyFields(self.__dict__, self.log_max_field_length)
         logger.info(
-            f"Executing {func.__name__} of {self.__class__.__name__} with attributes: {self.__dict__.items()}",
+            "Executing %s of %s with attributes: %s",
+            func.__name__,
+            tool,
+            fields,
+            extra={"tool": tool, "tool_fields": self.__dict__},
         )
         try:
             result = func(self, *args, **kwargs)
-            logger.info(
-                f"{func.__name__} of {self.__class__.__name__} with attributes: {self.__dict__.items()} completed successfully. Result: {result}",
-            )
-            return result
         except Exception as e:
-            logger.error(
-                f"Error occurred in {func.__name__} of {self.__class__.__name__} with attributes: {self.__dict__.items()}: {e}",
-            )
+            _log_error(logger, func, self, e)
             raise
+        if isinstance(result, ToolTimeout):
+            logger.warning(
+                "%s of %s with attributes: %s timed out after %ss",
+                func.__name__,
+                tool,
+                fields,
+                result.timeout,
+                extra={"tool": tool, "tool_fields": self.__dict__},
+            )
+            return result
+        logger.info(
+            "%s of %s with attributes: %s completed successfully. Result: %s",
+            func.__name__,
+            tool,
+            fields,
+            LazyValue(result, self.log_max_result_length),
+            extra={"tool": tool, "tool_fields": self.__dict__, "tool_result": result},
+        )
+        return result
+
+    return wrapper
+
+
+def _log_error(logger, func, tool, error):
+    logger.error(
+        "Error occurred in %s of %s with attributes: %s: %s",
+        func.__name__,
+        tool.__class__.__name__,
+        LazyFields(tool.__dict__, tool.log_max_field_length),
+        error,
+        extra={"tool": tool.__class__.__name__, "tool_fields": tool.__dict__},
+    )
+
+
+@dataclass(frozen=True)
+class ToolTimeout:
+    """Result of a tool call that did not finish within its `run_timeout`.
+
+    Its string form, which is what the agent receives, is a JSON object.
+    """
+
+    tool: str
+    timeout: float
+    error: str = "timeout"
+
+    @property
+    def message(self) -> str:
+        return (
+            f"{self.tool} did not finish within {self.timeout} seconds and was "
+            "cancelled. Retry with a smaller request or use another tool."
+        )
+
+    def __str__(self) -> str:
+        return json.dumps({**asdict(self), "message": self.message})
+
+
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = (
+    contextvars.ContextVar("swarmbasecore_tool_cancel_event", default=None)
+)
+
+
+def cancellation_requested() -> bool:
+    """Return whether the tool call running in this thread has timed out.
+
+    Long running tools can poll it to stop early once their result is no
+    longer awaited.
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def run_with_timeout(func):
+    """Decorator bounding `run` by the tool class's `run_timeout`.
+
+    Without a timeout, `run` is called inline. Otherwise it runs on a daemon
+    worker thread, in a copy of the caller's context. When the deadline
+    passes, the worker is flagged through `cancellation_requested` and left
+    to finish in the background, and a `ToolTimeout` is returned.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        timeout = self.run_timeout
+        if timeout is None:
+            return func(self, *args, **kwargs)
+
+        cancel = threading.Event()
+        outcome: Dict[str, Any] = {}
+
+        def target():
+            _cancel_event.set(cancel)
+            try:
+                outcome["result"] = func(self, *args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+
+        context = contextvars.copy_context()
+        worker = threading.Thread(
+            target=context.run,
+            args=(target,),
+            name=f"swarmbasecore-tool-{self.__class__.__name__}",
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            cancel.set()
+            return ToolTimeout(tool=self.__class__.__name__, timeout=timeout)
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    return wrapper
+
+
+class ToolResultCache:
+    """Memoized results of one tool class.
+
+    Results are kept in a bounded in-memory LRU with an optional time to live,
+    and, if `directory` is set, pickled to disk so they survive restarts.
+    Values are deep-copied on the way in and out, so callers mutating a result
+    do not change what later hits return; values that cannot be copied are
+    not stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        directory: Optional[str] = None,
+    ):
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.directory = Path(directory) if directory else None
+        self.disk_hits = 0
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        found, value = self.memory.lookup(key)
+        if found:
+            return True, copy.deepcopy(value)
+        if self.directory is None:
+            return False, None
+
+        path = self.directory / f"{key}.pickle"
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime >= self.ttl:
+                return False, None
+            with path.open("rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        self.disk_hits += 1
+        self.memory.set(key, value)
+        return True, copy.deepcopy(value)
+
+    def store(self, key: str, value: Any) -> None:
+        try:
+            value = copy.deepcopy(value)
+        except (TypeError, copy.Error):
+            return
+        self.memory.set(key, value)
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.pickle"
+        temporary_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with temporary_path.open("wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            temporary_path.unlink(missing_ok=True)
+
+    def info(self) -> Dict[str, Any]:
+        memory = self.memory.info()
+        return {
+            "hits": memory.hits,
+            "disk_hits": self.disk_hits,
+            "misses": memory.misses - self.disk_hits,
+            "size": memory.size,
+            "maxsize": memory.maxsize,
+        }
+
+
+def memoize_run(func):
+    """Decorator serving `run` from the tool class's result cache.
+
+    Caching only applies when the class sets `cache_results`. The cache key is
+    a SHA-256 hash of the tool's class and JSON-serialized field values.
+    Exceptions, timeouts, iterators and generators are not cached.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.cache_results or args or kwargs:
+            return func(self, *args, **kwargs)
+
+        cache = self.__class__.result_cache()
+        key = self.cache_key()
+        found, result = cache.lookup(key)
+        if found:
+            return result
+        result = func(self)
+        if not isinstance(result, (ToolTimeout, Iterator)):
+            cache.store(key, result)
+        return result
 
     return wrapper
 
 
 class LoggedBaseTool(BaseTool, ABC):
+    log_max_field_length: ClassVar[Optional[int]] = 200
+    log_max_result_length: ClassVar[Optional[int]] = 1000
+
+    cache_results: ClassVar[bool] = False
+    cache_maxsize: ClassVar[Optional[int]] = 128
+    cache_ttl: ClassVar[Optional[float]] = None
+    cache_dir: ClassVar[Optional[str]] = None
+
+    run_timeout: ClassVar[Optional[float]] = None
+    max_concurrency: ClassVar[Optional[int]] = None
+    run_in_process: ClassVar[bool] = False
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls.logger = setup_logger("LoggedBaseTool", cls.__name__)
+        cls._result_cache = None
         # Apply the decorator to the `run` method if it exists
         if "run" in cls.__dict__:
-            cls.run = log_execution(cls.logger, cls.run)
+            cls._undecorated_run = cls.run
+            cls.run = log_execution(
+                cls.logger,
+                memoize_run(run_with_timeout(run_in_process(cls.run))),
+            )
+
+    @classmethod
+    def result_cache(cls) -> ToolResultCache:
+        """Return the result cache of the tool class, creating it on first use."""
+        with _result_cache_lock:
+            if cls.__dict__.get("_result_cache") is None:
+                cls._result_cache = ToolResultCache(
+                    maxsize=cls.cache_maxsize,
+                    ttl=cls.cache_ttl,
+                    directory=(
+                        os.path.join(cls.cache_dir, cls.__name__)
+                        if cls.cache_dir
+                        else None
+                    ),
+                )
+            return cls._result_cache
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Return the hit, miss and size counters of the tool's result cache."""
+        return cls.result_cache().info()
+
+    def cache_key(self) -> str:
+        """Return a stable hash of the tool class and its field values."""
+        payload = json.dumps(
+            {
+                "tool": f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                "fields": self.model_dump(mode="json"),
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_result_cache_lock = threading.Lock()
@@ -0,0 +1,214 @@
+"""swarmbasecore.agency_swarm_framework.tool_executor
+
+This module runs the independent tool calls of one agent turn concurrently.
+
+agency_swarm executes the tool calls of a run one after another. When a
+`SwarmyAgency` is created with `tool_workers`, its threads submit every
+eligible call of a turn to a shared thread pool as soon as the run requires
+action, and the regular sequential loop then collects the results, so outputs,
+streamed messages and tracking keep the original call order.
+
+A call is eligible when its tool is a `LoggedBaseTool` that is not limited to
+one call at a time; SendMessage and file search calls always run inline. As
+the sequential loop ends the run after a tool with `output_as_result`, calls
+that would come after such a tool are not submitted either. Each
+tool class can cap how many of its calls run at once with `max_concurrency`.
+Calls run in a copy of the submitting thread's context, so context variables
+used for logging are preserved.
+
+Key Classes:
+- ToolExecutor: Thread pool with per-tool concurrency caps.
+- ConcurrentToolCalls: Mixin for agency_swarm threads that executes the tool
+  calls of a turn through a `ToolExecutor`.
+
+Example:
+    from swarmbasecore.agency_swarm_framework import SwarmyAgency
+
+    agency = SwarmyAgency([ceo, [ceo, developer]], tool_workers=8)
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from agency_swarm.threads import Thread
+
+from .swarmy_tool import LoggedBaseTool
+
+
+class ToolExecutor:
+    """Shared thread pool running tool calls, with per-tool concurrency caps.
+
+    Args:
+        max_workers (int): Maximum number of tool calls running at once.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="swarmbasecore-tools",
+        )
+        self._limits: Dict[type, Optional[threading.BoundedSemaphore]] = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, tool_class: type) -> Optional[threading.BoundedSemaphore]:
+        with self._lock:
+            if tool_class not in self._limits:
+                max_concurrency = getattr(tool_class, "max_concurrency", None)
+                self._limits[tool_class] = (
+                    threading.BoundedSemaphore(max_concurrency)
+                    if max_concurrency
+                    else None
+                )
+            return self._limits[tool_class]
+
+    def submit(
+        self,
+        tool_class: type,
+        fn: Callable[..., Any],
+        *args: Any,
+    ) -> Future:
+        """Run `fn(*args)` for a call of `tool_class` in the caller's context."""
+        context = contextvars.copy_context()
+        limit = self._limit(tool_class)
+
+        def call():
+            if limit is None:
+                return context.run(fn, *args)
+            with limit:
+                return context.run(fn, *args)
+
+        return self._executor.submit(call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ConcurrentToolCalls:
+    """Mixin for `agency_swarm.threads.Thread` executing tool calls concurrently."""
+
+    tool_executor: Optional[ToolExecutor] = None
+    _run: Any
+    _tool_futures: Dict[str, Future]
+
+    def _handle_run_requires_action(
+        self,
+        recipient_agent,
+        event_handler,
+        yield_messages,
+        parent_run_id,
+        additional_instructions,
+    ):
+        self._tool_futures = self._submit_tool_calls(recipient_agent, event_handler)
+        try:
+            return (
+                yield from super()._handle_run_requires_action(
+                    recipient_agent,
+                    event_handler,
+                    yield_messages,
+                    parent_run_id,
+                    additional_instructions,
+                )
+            )
+        finally:
+            # Calls left over when a tool's output ended the run early
+            for future in self._tool_futures.values():
+                future.cancel()
+            self._tool_futures = {}
+
+    def _submit_tool_calls(self, recipient_agent, event_handler) -> Dict[str, Future]:
+        if self.tool_executor is None:
+            return {}
+
+        functions = {func.__name__: func for func in recipient_agent.functions}
+        tool_calls = self._run.required_action.submit_tool_outputs.tool_calls
+        eligible = []
+        for tool_call in _execution_order(tool_calls, functions):
+            if tool_call.type != "function":
+                continue
+            tool = functions.get(tool_call.function.name)
+            if (
+                isinstance(tool, type)
+                and issubclass(tool, LoggedBaseTool)
+                and not getattr(tool.ToolConfig, "one_call_at_a_time", False)
+            ):
+                eligible.append((tool_call, tool))
+            if _tool_config(tool, "output_as_result"):
+                # The run ends after this call, later calls are never executed
+                break
+
+        if len(eligible) < 2:
+            return {}
+        return {
+            tool_call.id: self.tool_executor.submit(
+                tool,
+                Thread.execute_tool,
+                self,
+                tool_call,
+                recipient_agent,
+                event_handler,
+            )
+            for tool_call, tool in eligible
+        }
+
+    def execute_tool(
+        self,
+        tool_call,
+        recipient_agent=None,
+        event_handler=None,
+        tool_outputs_and_names=None,
+    ):
+        future = getattr(self, "_tool_futures", {}).pop(tool_call.id, None)
+        if future is not None:
+            return future.result()
+        return super().execute_tool(
+            tool_call,
+            recipient_agent,
+            event_handler,
+            tool_outputs_and_names,
+        )
+
+
+def _tool_config(tool: Any, option: str) -> bool:
+    return bool(getattr(getattr(tool, "ToolConfig", None), option, False))
+
+
+def _execution_order(tool_calls: List[Any], functions: Dict[str, Any]) -> List[Any]:
+    """Order tool calls the way the sequential loop of agency_swarm runs them.
+
+    Calls of tools with `async_mode` are run after all the other calls.
+    """
+
+    def runs_last(tool_call) -> bool:
+        if tool_call.type != "function":
+            return False
+        name = tool_call.function.name
+        return not name.startswith("SendMessage") and _tool_config(
+            functions.get(name), "async_mode"
+        )
+
+    return sorted(tool_calls, key=runs_last)
+
+
+_concurrent_thread_types: Dict[type, type] = {}
+
+
+def enable_concurrent_tool_calls(thread: Thread, executor: ToolExecutor) -> None:
+    """Make `thread` execute the tool calls of each turn through `executor`.
+
+    agency_swarm instantiates its thread classes itself, so the thread is
+    switched to a `ConcurrentToolCalls` subclass of its own class.
+    """
+    thread_type = type(thread)
+    if not issubclass(thread_type, ConcurrentToolCalls):
+        concurrent_type = _concurrent_thread_types.get(thread_type)
+        if concurrent_type is None:
+            concurrent_type = _concurrent_thread_types[thread_type] = type(
+                f"Concurrent{thread_type.__name__}",
+                (ConcurrentToolCalls, thread_type),
+                {},
+            )
+        thread.__class__ = concurrent_type
+    thread.tool_executor = executor
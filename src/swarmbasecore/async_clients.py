@@ -0,0 +1,710 @@
+"""swarmbasecore.async_clients
+
+This module defines asyncio counterparts of the client classes in
+`swarmbasecore.clients`. Every method has the same name and arguments as its
+synchronous twin, but returns a coroutine, so thousands of resource fetches
+can run concurrently on a single thread.
+
+Key Classes:
+- AsyncConnectionPool: A keep-alive aiohttp connection pool bound to the
+  running event loop, with a limit on the number of concurrent requests.
+- AsyncBaseClient: An abstract base class that provides common functionality
+  for all async client classes.
+- AsyncAgentClient, AsyncFrameworkClient, AsyncSwarmClient, AsyncToolClient:
+  Async clients for the corresponding resources.
+
+Usage:
+All async clients created for the same base URL share one connection pool.
+Like the synchronous clients, they accept a `TTLCache` for GET responses,
+a `validator_cache` and a `coalesce` flag, and provide the same paginated
+`iter_list` and bulk `*_many` methods.
+Use `get_async_connection_pool` to configure it before creating the clients,
+or pass a dedicated pool to a client.
+
+Example:
+    import asyncio
+    from swarmbasecore.async_clients import AsyncAgentClient
+
+    async def main():
+        agent_client = AsyncAgentClient(base_url="127.0.0.1:5000")
+        agents = await asyncio.gather(
+            *(agent_client.get(agent_id) for agent_id in agent_ids),
+        )
+        await agent_client.pool.close()
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from abc import ABC
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import aiohttp
+
+from .clients import (
+    BulkResult,
+    allowed_methods,
+    bulk_results,
+    invalidated_by,
+    keyed_items,
+    page_params,
+    split_page,
+)
+from .utils import AsyncSingleFlight, CacheInfo, TTLCache
+from .utils.utils import conditional_headers, validated_response, validator_key
+
+AsyncClientT = TypeVar("AsyncClientT", bound="AsyncBaseClient")
+
+# Concurrent identical GETs of clients created with `coalesce=True` share one
+# request, across all clients running on the same event loop
+in_flight_gets = AsyncSingleFlight()
+
+
+class AsyncConnectionPool:
+    """Keep-alive aiohttp connection pool with a concurrency limit.
+
+    An ``aiohttp.ClientSession`` is created lazily for each event loop the
+    pool is used from, so several threads, or consecutive ``asyncio.run``
+    calls, can share one pool. Each session is closed on its own loop when
+    the loop cancels its remaining tasks on shutdown, as ``asyncio.run``
+    does, or by ``close``.
+
+    Args:
+        limit (int): Maximum number of open connections.
+        limit_per_host (int): Maximum number of open connections per host,
+            ``0`` for no per-host limit.
+        keepalive_timeout (float): Seconds an idle connection is kept open.
+        max_concurrency (int): Maximum number of requests in flight at once.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 60.0,
+        max_concurrency: int = 100,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        # The session of each event loop, with its request semaphore and the
+        # task closing it when the loop shuts down
+        self._sessions: Dict[
+            asyncio.AbstractEventLoop,
+            Tuple[aiohttp.ClientSession, asyncio.Semaphore, "asyncio.Task[None]"],
+        ] = {}
+
+    async def _ensure_session(
+        self,
+    ) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._sessions.get(loop)
+            if entry is None or entry[0].closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+                session = aiohttp.ClientSession(connector=connector)
+                entry = self._sessions[loop] = (
+                    session,
+                    asyncio.Semaphore(self.max_concurrency),
+                    loop.create_task(_close_at_shutdown(session)),
+                )
+            # Loops closed without cancelling their tasks leave their session
+            # behind; it can only be marked as closed
+            orphaned = [
+                self._sessions.pop(other)[0]
+                for other in list(self._sessions)
+                if other.is_closed()
+            ]
+        for session in orphaned:
+            await session.close()
+        return entry[0], entry[1]
+
+    async def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a request and return its status, headers and raw body."""
+        session, semaphore = await self._ensure_session()
+        async with semaphore:
+            async with session.request(
+                method,
+                url,
+                headers=headers,
+                json=data,
+                params=params,
+            ) as response:
+                response.raise_for_status()
+                content = await response.read()
+                return response.status, response.headers.copy(), content
+
+    async def request(self, method, url, headers=None, data=None, params=None):
+        """Send a request and return the decoded JSON body, if any."""
+        _, _, content = await self.send(method, url, headers, data, params)
+        if content:
+            return json.loads(content)
+        return None
+
+    async def close(self) -> None:
+        """Close all connections held by the pool, on every event loop.
+
+        Sessions of event loops that are running in other threads are closed
+        on their own loop. Those of loops that are neither running nor closed
+        are kept, as they cannot be closed from here.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        for session_loop, entry in sessions:
+            session, _, closer = entry
+            if session_loop is loop or session_loop.is_closed():
+                closer.cancel()
+                await session.close()
+            elif session_loop.is_running():
+                session_loop.call_soon_threadsafe(closer.cancel)
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), session_loop),
+                )
+            else:
+                with self._lock:
+                    self._sessions.setdefault(session_loop, entry)
+
+
+async def _close_at_shutdown(session: aiohttp.ClientSession) -> None:
+    """Wait until cancelled, then close `session`."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+
+_async_connection_pools: Dict[str, AsyncConnectionPool] = {}
+_async_connection_pools_lock = threading.Lock()
+
+
+def get_async_connection_pool(base_url: str, **pool_kwargs) -> AsyncConnectionPool:
+    """Return the async connection pool shared by all clients of ``base_url``.
+
+    The pool is created on first use with ``pool_kwargs``; later calls for the
+    same ``base_url`` return the existing pool and ignore ``pool_kwargs``.
+    """
+    with _async_connection_pools_lock:
+        pool = _async_connection_pools.get(base_url)
+        if pool is None:
+            pool = _async_connection_pools[base_url] = AsyncConnectionPool(
+                **pool_kwargs,
+            )
+        return pool
+
+
+async def close_async_connection_pools() -> None:
+    """Close and forget every shared async connection pool."""
+    with _async_connection_pools_lock:
+        pools = list(_async_connection_pools.values())
+        _async_connection_pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+async def make_async_request(
+    method,
+    url,
+    headers=None,
+    data=None,
+    params=None,
+    pool=None,
+    validator_cache=None,
+):
+    """Make an HTTP request without blocking the event loop.
+
+    Args:
+        method (str): The HTTP method (e.g., 'GET', 'POST').
+        url (str): The URL to send the request to.
+        headers (dict, optional): Additional headers to include in the request.
+        data (dict, optional): The data to send in the request body.
+        params (dict, optional): URL parameters to include in the request.
+        pool (AsyncConnectionPool, optional): Connection pool to send the
+            request through. Defaults to a temporary single-use pool.
+        validator_cache (TTLCache, optional): Cache of the validators of GET
+            responses, used for conditional requests as in `make_request`.
+
+    Returns:
+        dict or None: The JSON response data if available, otherwise None.
+    """
+    headers = headers or {"Content-Type": "application/json"}
+    if pool is not None:
+        return await _send(pool, method, url, headers, data, params, validator_cache)
+
+    pool = AsyncConnectionPool()
+    try:
+        return await _send(pool, method, url, headers, data, params, validator_cache)
+    finally:
+        await pool.close()
+
+
+async def _send(pool, method, url, headers, data, params, validator_cache):
+    if validator_cache is None or method != "GET":
+        return await pool.request(method, url, headers, data, params)
+
+    key = validator_key(url, params)
+    cached = validator_cache.get(key)
+    if cached is not None:
+        headers = {**headers, **conditional_headers(cached)}
+    status, response_headers, content = await pool.send(
+        method,
+        url,
+        headers,
+        data,
+        params,
+    )
+    if cached is not None and status == 304:
+        return copy.deepcopy(cached.data)
+    json_data = json.loads(content) if content else None
+    validated = validated_response(response_headers, json_data)
+    if validated is not None:
+        # The caller owns json_data, so the cache keeps a copy of its own
+        validator_cache.set(key, validated._replace(data=copy.deepcopy(json_data)))
+    else:
+        validator_cache.pop(key)
+    return json_data
+
+
+async def run_concurrently(
+    calls: Sequence[Callable[[], Awaitable[Any]]],
+    max_concurrency: int = 8,
+) -> List[BulkResult]:
+    """Await `calls`, at most `max_concurrency` at once, and collect their outcomes."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> BulkResult:
+        async with semaphore:
+            try:
+                return BulkResult(await call())
+            except Exception as e:
+                return BulkResult(error=e)
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
+
+
+class AsyncBaseClient(ABC):
+    def __init__(
+        self,
+        base_url: str,
+        resource: str,
+        pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        self.base_url = base_url
+        self.client_url = f"{base_url}/api/{resource}"
+        self.pool = pool if pool is not None else get_async_connection_pool(base_url)
+        self.cache = cache
+        self.validator_cache = validator_cache
+        self.coalesce = coalesce
+        self.bulk_url = f"{base_url}/api/bulk/{resource}"
+        self._bulk_methods: Dict[str, FrozenSet[str]] = {}
+
+    def derive(self, client_class: Callable[..., AsyncClientT]) -> AsyncClientT:
+        """Return a `client_class` client sharing this client's pool and caches."""
+        return client_class(
+            self.base_url,
+            pool=self.pool,
+            cache=self.cache,
+            validator_cache=self.validator_cache,
+            coalesce=self.coalesce,
+        )
+
+    async def _fetch(self, url: str, params=None):
+        def fetch():
+            return make_async_request(
+                "GET",
+                url,
+                params=params,
+                pool=self.pool,
+                validator_cache=self.validator_cache,
+            )
+
+        if not self.coalesce:
+            return await fetch()
+        return await in_flight_gets.do(validator_key(url, params), fetch)
+
+    async def _request(self, method: str, url: str, data=None, params=None):
+        if method != "GET":
+            try:
+                return await make_async_request(
+                    method,
+                    url,
+                    data=data,
+                    params=params,
+                    pool=self.pool,
+                )
+            finally:
+                self._invalidate(url)
+
+        if self.cache is None:
+            return await self._fetch(url, params)
+
+        key = validator_key(url, params)
+        found, response = self.cache.lookup(key)
+        if not found:
+            generation = self.cache.generation
+            response = await self._fetch(url, params)
+            self.cache.set(key, response, generation=generation)
+        return copy.deepcopy(response)
+
+    def _invalidate(self, *urls: str) -> None:
+        predicates = [invalidated_by(self.client_url, url) for url in urls]
+
+        def stale(key: Any) -> bool:
+            return key[0] == self.bulk_url or any(match(key) for match in predicates)
+
+        # GETs sent before the write must not be joined by the GETs after it
+        in_flight_gets.forget(stale)
+        if self.cache is not None:
+            self.cache.pop_matching(stale)
+
+    def _resource_urls(self, resource_ids: Iterable[str]) -> List[str]:
+        return [f"{self.client_url}/{resource_id}" for resource_id in resource_ids]
+
+    async def _supports_bulk(self, url: str, method: str) -> bool:
+        """Return whether the server advertises `method` on the bulk endpoint `url`."""
+        methods = self._bulk_methods.get(url)
+        if methods is None:
+            try:
+                _, headers, _ = await self.pool.send("OPTIONS", url)
+                methods = allowed_methods(headers)
+            except aiohttp.ClientResponseError:
+                methods = frozenset()
+            except aiohttp.ClientError:
+                # Try again on the next bulk call
+                return False
+            self._bulk_methods[url] = methods
+        return method in methods
+
+    async def _bulk(
+        self,
+        method: str,
+        url: str,
+        calls: Sequence[Callable[[], Awaitable[Any]]],
+        data=None,
+        params=None,
+        invalidates: Iterable[str] = (),
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Send a bulk request to `url`, or run `calls` concurrently without one."""
+        if not calls:
+            return []
+        if not await self._supports_bulk(url, method):
+            return await run_concurrently(calls, max_concurrency)
+
+        try:
+            if method == "GET":
+                response = await self._fetch(url, params)
+            else:
+                try:
+                    response = await make_async_request(
+                        method,
+                        url,
+                        data=data,
+                        params=params,
+                        pool=self.pool,
+                    )
+                finally:
+                    self._invalidate(self.client_url, *invalidates)
+        except Exception as e:
+            return [BulkResult(error=e) for _ in calls]
+        return bulk_results(response, len(calls))
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Return the response cache's hit and miss counters, if it has a cache."""
+        return self.cache.info() if self.cache is not None else None
+
+    async def create(self, data: Dict[str, Any]):
+        return await self._request("POST", self.client_url, data=data)
+
+    async def list(self):
+        return await self._request("GET", self.client_url)
+
+    async def iter_list(
+        self,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the collection one page at a time.
+
+        Args:
+            page_size (int): Number of items to request per page.
+            prefetch (bool): Whether to fetch the next page in a task while
+                the items of the current one are consumed.
+
+        Yields:
+            The items of the collection.
+        """
+        params = page_params(page_size)
+        if not prefetch:
+            next_params: Optional[Dict[str, Any]] = params
+            while next_params is not None:
+                params = next_params
+                items, next_params = split_page(
+                    params, await self._request("GET", self.client_url, params=params)
+                )
+                for item in items:
+                    yield item
+            return
+
+        task: "Optional[asyncio.Future[Any]]" = asyncio.ensure_future(
+            self._request("GET", self.client_url, params=params)
+        )
+        try:
+            while task is not None:
+                items, next_params = split_page(params, await task)
+                task = None
+                if next_params is not None:
+                    params = next_params
+                    task = asyncio.ensure_future(
+                        self._request("GET", self.client_url, params=params)
+                    )
+                for item in items:
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def get(self, resource_id: str):
+        url = f"{self.client_url}/{resource_id}"
+        return await self._request("GET", url)
+
+    async def update(self, resource_id: str, data: Dict[str, Any]):
+        url = f"{self.client_url}/{resource_id}"
+        return await self._request("PUT", url, data=data)
+
+    async def delete(self, resource_id: str):
+        url = f"{self.client_url}/{resource_id}"
+        return await self._request("DELETE", url)
+
+    async def create_many(
+        self,
+        items: Iterable[Dict[str, Any]],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Create several resources, see `BaseClient.create_many`."""
+        items = list(items)
+        return await self._bulk(
+            "POST",
+            self.bulk_url,
+            [partial(self.create, item) for item in items],
+            data=items,
+            max_concurrency=max_concurrency,
+        )
+
+    async def get_many(
+        self,
+        resource_ids: Iterable[str],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Retrieve several resources, in the order of `resource_ids`."""
+        resource_ids = list(resource_ids)
+        return await self._bulk(
+            "GET",
+            self.bulk_url,
+            [partial(self.get, resource_id) for resource_id in resource_ids],
+            params={"ids": ",".join(map(str, resource_ids))},
+            max_concurrency=max_concurrency,
+        )
+
+    async def update_many(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Update several resources, given as a mapping of resource ID to data."""
+        pairs = list(updates.items())
+        return await self._bulk(
+            "PUT",
+            self.bulk_url,
+            [partial(self.update, *pair) for pair in pairs],
+            data=keyed_items(pairs),
+            invalidates=self._resource_urls(updates),
+            max_concurrency=max_concurrency,
+        )
+
+    async def delete_many(
+        self,
+        resource_ids: Iterable[str],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Delete several resources, in the order of `resource_ids`."""
+        resource_ids = list(resource_ids)
+        return await self._bulk(
+            "DELETE",
+            self.bulk_url,
+            [partial(self.delete, resource_id) for resource_id in resource_ids],
+            data=resource_ids,
+            invalidates=self._resource_urls(resource_ids),
+            max_concurrency=max_concurrency,
+        )
+
+
+class AsyncAgentClient(AsyncBaseClient):
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "agents", pool, cache, validator_cache, coalesce)
+
+    async def assign_tool_to_agent(self, agent_id: str, tool_data: Dict[str, Any]):
+        url = f"{self.client_url}/{agent_id}/tools"
+        return await self._request("POST", url, data=tool_data)
+
+    async def remove_tool_from_agent(self, agent_id: str, tool_data: Dict[str, Any]):
+        url = f"{self.client_url}/{agent_id}/tools"
+        return await self._request("DELETE", url, data=tool_data)
+
+    async def get_tools(self, agent_id: str):
+        url = f"{self.client_url}/{agent_id}/tools"
+        return await self._request("GET", url)
+
+    async def add_relationship(self, agent_id: str, data: Dict[str, Any]):
+        url = f"{self.client_url}/{agent_id}/relationships"
+        return await self._request("POST", url, data=data)
+
+    async def get_relationships(self, agent_id: str):
+        url = f"{self.client_url}/{agent_id}/relationships"
+        return await self._request("GET", url)
+
+    async def remove_relationship(self, agent_id: str, related_agent_id: str):
+        url = f"{self.client_url}/{agent_id}/relationships/{related_agent_id}"
+        return await self._request("DELETE", url)
+
+    async def assign_tools(
+        self,
+        assignments: Iterable[Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Assign tools to agents, given as `(agent_id, tool_data)` pairs."""
+        assignments = list(assignments)
+        return await self._bulk(
+            "POST",
+            f"{self.bulk_url}/tools",
+            [partial(self.assign_tool_to_agent, *pair) for pair in assignments],
+            data=keyed_items(assignments),
+            invalidates=self._resource_urls(id for id, _ in assignments),
+            max_concurrency=max_concurrency,
+        )
+
+    async def add_relationships(
+        self,
+        relationships: Iterable[Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = 8,
+    ) -> List[BulkResult]:
+        """Add relationships to agents, given as `(agent_id, data)` pairs."""
+        relationships = list(relationships)
+        return await self._bulk(
+            "POST",
+            f"{self.bulk_url}/relationships",
+            [partial(self.add_relationship, *pair) for pair in relationships],
+            data=keyed_items(relationships),
+            invalidates=self._resource_urls(id for id, _ in relationships),
+            max_concurrency=max_concurrency,
+        )
+
+
+class AsyncFrameworkClient(AsyncBaseClient):
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "frameworks", pool, cache, validator_cache, coalesce)
+
+    async def add_swarm_to_framework(
+        self,
+        framework_id: str,
+        swarm_data: Dict[str, Any],
+    ):
+        url = f"{self.client_url}/{framework_id}/swarms"
+        return await self._request("POST", url, data=swarm_data)
+
+    async def remove_swarm_from_framework(
+        self,
+        framework_id: str,
+        swarm_data: Dict[str, Any],
+    ):
+        url = f"{self.client_url}/{framework_id}/swarms"
+        return await self._request("POST", url, data=swarm_data)
+
+    async def add_tool_to_framework(self, framework_id: str, tool_data):
+        url = f"{self.client_url}/{framework_id}/tools"
+        return await self._request("POST", url, data=tool_data)
+
+
+class AsyncSwarmClient(AsyncBaseClient):
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "swarms", pool, cache, validator_cache, coalesce)
+
+    async def add_agent_to_swarm(self, swarm_id: str, agent_data: Dict[str, Any]):
+        url = f"{self.client_url}/{swarm_id}/agents"
+        return await self._request("POST", url, data=agent_data)
+
+    async def remove_agent_from_swarm(
+        self,
+        swarm_id: str,
+        agent_data: Dict[str, Any],
+    ):
+        url = f"{self.client_url}/{swarm_id}/agents"
+        return await self._request("DELETE", url, data=agent_data)
+
+
+class AsyncToolClient(AsyncBaseClient):
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "tools", pool, cache, validator_cache, coalesce)
@@ -25,6 +25,10 @@ Builders:
     - FrameworkBuilder: A builder specifically for creating Framework instances.
     - SwarmBuilder: A builder specifically for creating Swarm instances.
 
+Hydration:
+    - IdentityMap: A per-session registry of products built by ``from_id``,
+    so every agent and tool id is fetched and built only once.
+
 Usage:
 To use the builders, instantiate the appropriate builder class and use its 
 methods to set the desired attributes before calling the build method to 
@@ -44,13 +48,16 @@ Example:
 
 import keyword
 import re
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import asdict, field
 from datetime import datetime
 from typing import (
     Any,
     ClassVar,
+    Container,
     Dict,
     Generic,
+    Iterable,
     List,
     Optional,
     TypeVar,
@@ -110,6 +117,18 @@ class Product:
 T = TypeVar("T", bound="Product")
 
 
+class IdentityMap:
+    """Registry of products already hydrated with ``from_id`` in one session.
+
+    Builders look ids up here before querying the API and register what they
+    build, so each agent and tool is fetched once and shared by reference.
+    """
+
+    def __init__(self):
+        self.agents: Dict[str, "Agent"] = {}
+        self.tools: Dict[str, "Tool"] = {}
+
+
 @dataclass(
     config=ConfigDict(arbitrary_types_allowed=True, revalidate_instances="always"),
 )
@@ -182,8 +201,23 @@ class ToolBuilder(BaseBuilder[Tool]):
     def set_code(self, code):
         self._product.code = code
 
-    def from_id(self, id: str):
-        data = self.client.get(id)
+    def from_id(self, id: str, identity_map: Optional[IdentityMap] = None):
+        if identity_map is not None and id in identity_map.tools:
+            self._product = identity_map.tools[id]
+            return self
+
+        return self.from_data(id, self.client.get(id), identity_map)
+
+    def from_data(
+        self,
+        id: str,
+        data: Any,
+        identity_map: Optional[IdentityMap] = None,
+    ):
+        """Populate the tool from an already fetched API payload.
+
+        ``data`` is the decoded JSON the API returned for the tool, or None.
+        """
         if data:
             self.set_id(data.get("id"))
             self.set_name(data.get("name"))
@@ -203,6 +237,8 @@ class ToolBuilder(BaseBuilder[Tool]):
             )
             self.set_version(newest_code_data.get("version"))
             self.set_code(newest_code_data.get("code"))
+            if identity_map is not None:
+                identity_map.tools[id] = self._product
         return self
 
 
@@ -250,9 +286,45 @@ class AgentBuilder(BaseBuilder[Agent]):
         self._product.tools.append(tool)
         return self
 
-    def from_id(self, id: str):
+    def from_id(
+        self,
+        id: str,
+        identity_map: Optional[IdentityMap] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Hydrate the agent and its tools from the API.
+
+        With ``max_workers`` set, the agent's tools are fetched concurrently
+        by that many threads before the agent is built.
+        """
+        if identity_map is not None and id in identity_map.agents:
+            self._product = identity_map.agents[id]
+            return self
+
         data = self.client.get(id)
-        tool_builder = ToolBuilder(ToolClient(self.client.base_url))
+        if data and max_workers:
+            if identity_map is None:
+                identity_map = IdentityMap()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                _prefetch_tools(
+                    self.client.derive(ToolClient),
+                    data.get("tools"),
+                    identity_map,
+                    executor,
+                )
+        return self.from_data(id, data, identity_map)
+
+    def from_data(
+        self,
+        id: str,
+        data: Any,
+        identity_map: Optional[IdentityMap] = None,
+    ):
+        """Populate the agent from an already fetched API payload.
+
+        ``data`` is the decoded JSON the API returned for the agent, or None.
+        """
+        tool_builder = ToolBuilder(self.client.derive(ToolClient))
 
         if data:
             self.set_id(data.get("id"))
@@ -270,7 +342,10 @@ class AgentBuilder(BaseBuilder[Agent]):
                 self.add_relationship(relationship)
 
             for tool_id in data.get("tools"):
-                self.add_tool(tool_builder.from_id(tool_id).product)
+                self.add_tool(tool_builder.from_id(tool_id, identity_map).product)
+
+            if identity_map is not None:
+                identity_map.agents[id] = self._product
 
         return self
 
@@ -326,22 +401,50 @@ class SwarmBuilder(BaseBuilder[Swarm]):
             self._product.tools[tool.id] = tool
         return self
 
-    def from_id(self, id: str):
+    def from_id(
+        self,
+        id: str,
+        identity_map: Optional[IdentityMap] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Hydrate the swarm, its agents and their tools from the API.
+
+        Every agent and tool is fetched once per ``identity_map`` and the same
+        instance is shared across ``Swarm.agents``, ``Swarm.tools`` and
+        ``Agent.tools``. A fresh map is used when none is given.
+
+        With ``max_workers`` set, agents are discovered breadth-first through
+        their relationships and each level, followed by all their tools, is
+        fetched concurrently by that many threads. The resulting swarm is the
+        same as the one built sequentially.
+        """
+        if identity_map is None:
+            identity_map = IdentityMap()
         data = self.client.get(id)
 
-        agent_builder = AgentBuilder(AgentClient(self.client.base_url))
+        agent_builder = AgentBuilder(self.client.derive(AgentClient))
         if data:
             self.set_id(data.get("id"))
             self.set_name(data.get("name"))
 
+            if max_workers:
+                self._prefetch(data, identity_map, max_workers)
+
             for agent_data in data.get("agents"):
-                agent: Agent = agent_builder.from_id(agent_data.get("id")).product
+                agent: Agent = agent_builder.from_id(
+                    agent_data.get("id"),
+                    identity_map,
+                ).product
                 for rel in agent.relationships:
                     self.add_agents_relationship(rel)
 
                     # adds source and target agents to dict
-                    self.add_agent(agent_builder.from_id(rel.source_agent_id).product)
-                    self.add_agent(agent_builder.from_id(rel.target_agent_id).product)
+                    self.add_agent(
+                        agent_builder.from_id(rel.source_agent_id, identity_map).product,
+                    )
+                    self.add_agent(
+                        agent_builder.from_id(rel.target_agent_id, identity_map).product,
+                    )
 
                 for tool in agent.tools:
                     self.add_tool(tool)
@@ -349,3 +452,86 @@ class SwarmBuilder(BaseBuilder[Swarm]):
             self.set_extra_attributes(data.get("extra_attributes"))
 
         return self
+
+    def _prefetch(
+        self,
+        data: Any,
+        identity_map: IdentityMap,
+        max_workers: int,
+    ) -> None:
+        """Concurrently fetch every agent and tool reachable from the swarm."""
+        agent_client = self.client.derive(AgentClient)
+        tool_client = self.client.derive(ToolClient)
+        # Decoded JSON payloads, None for agents the API did not return
+        agents_data: Dict[str, Any] = {}
+
+        def fetch_level(agent_ids: List[str]) -> List[Any]:
+            fetched = list(executor.map(agent_client.get, agent_ids))
+            agents_data.update(zip(agent_ids, fetched))
+            return fetched
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Listed agents first, then the agents on the other end of their
+            # relationships, mirroring what the sequential path reaches.
+            listed = fetch_level(
+                _unseen(
+                    (agent_data.get("id") for agent_data in data.get("agents")),
+                    identity_map.agents,
+                ),
+            )
+            fetch_level(
+                _unseen(
+                    (
+                        agent_id
+                        for agent_data in listed
+                        if agent_data
+                        for rel in agent_data.get("relationships")
+                        for agent_id in (
+                            rel.get("source_agent_id"),
+                            rel.get("target_agent_id"),
+                        )
+                    ),
+                    identity_map.agents,
+                    agents_data,
+                ),
+            )
+
+            _prefetch_tools(
+                tool_client,
+                (
+                    tool_id
+                    for agent_data in agents_data.values()
+                    if agent_data
+                    for tool_id in agent_data.get("tools")
+                ),
+                identity_map,
+                executor,
+            )
+
+        agent_builder = AgentBuilder(agent_client)
+        for agent_id, agent_data in agents_data.items():
+            agent_builder.from_data(agent_id, agent_data, identity_map).reset()
+
+
+def _unseen(ids: Iterable[str], *seen: Container[str]) -> List[str]:
+    """Return the unique ``ids`` not contained in any of ``seen``, in order."""
+    return [
+        id
+        for id in dict.fromkeys(ids)
+        if not any(id in container for container in seen)
+    ]
+
+
+def _prefetch_tools(
+    client: ToolClient,
+    tool_ids: Iterable[str],
+    identity_map: IdentityMap,
+    executor: Executor,
+) -> None:
+    """Fetch the tools missing from ``identity_map`` using ``executor``."""
+
+    def hydrate(tool_id: str) -> None:
+        ToolBuilder(client).from_id(tool_id, identity_map)
+
+    for _ in executor.map(hydrate, _unseen(tool_ids, identity_map.tools)):
+        pass
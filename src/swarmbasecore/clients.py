@@ -4,6 +4,25 @@ This module defines client classes that facilitate communication with the SwarmB
 Each client is responsible for making API requests to manage resources such as
 agents, tools, frameworks, and swarms.
 The clients provide a structured way to interact with the underlying RESTful services.
+All clients created for the same base URL share one keep-alive connection pool.
+
+Clients can be given a `TTLCache` to serve repeated GET requests from memory.
+Writes through a client invalidate the cached responses of the resource they
+change, as well as the cached listings of its collection; `cache_info()`
+returns the hit and miss counters. Clients can also be given a
+`validator_cache`, in which case responses carrying an `ETag` or
+`Last-Modified` header are kept and later revalidated with a conditional GET,
+so unchanged resources are not downloaded again. Clients created with
+`coalesce=True` share one HTTP request between concurrent identical GETs; a
+GET sent after a write never shares the request of a GET sent before it.
+Use `derive` to create a client for another resource with the same settings.
+`iter_list` iterates over large collections one page at a time.
+
+The `*_many` methods create, retrieve, update or delete several resources at
+once. They use the server's bulk endpoint under `/api/bulk/<resource>` when it
+advertises the method in the `Allow` header of an OPTIONS request, and
+otherwise send the requests concurrently. Each returns a `BulkResult` per
+item, holding either its result or its error.
 
 Key Classes:
 - BaseClient: An abstract base class that provides common functionality for 
@@ -18,6 +37,7 @@ Key Classes:
   adding and removing agents from swarms.
 - ToolClient: A client for managing tool resources, with methods for creating 
   and manipulating tools.
+- BulkResult: The result, or the error, of one item of a bulk operation.
 
 Usage:
 To use the clients, instantiate the appropriate client class with the base URL 
@@ -28,70 +48,529 @@ Example:
 
     agent_client = AgentClient(base_url="127.0.0.1:5000")
     new_agent = agent_client.create(data={"name": "Agent 1", "description": "First agent"})
+
+    # Clients can also be given a dedicated, custom-sized connection pool
+    from swarmbasecore.utils import ConnectionPool
+
+    tool_client = ToolClient("127.0.0.1:5000", pool=ConnectionPool(pool_maxsize=32))
+
+    # Cache GET responses for five minutes
+    from swarmbasecore.utils import TTLCache
+
+    agent_client = AgentClient("127.0.0.1:5000", cache=TTLCache(maxsize=1024, ttl=300))
+    agent_client.get(agent_id)  # fetched
+    agent_client.get(agent_id)  # served from the cache
+    print(agent_client.cache_info())
+
+    # Revalidate instead of downloading unchanged tools again
+    tool_client = ToolClient("127.0.0.1:5000", validator_cache=TTLCache(maxsize=4096))
+
+    # Stream a large collection without loading it into memory at once
+    for tool in tool_client.iter_list(page_size=50):
+        print(tool["name"])
+
+    # Create many tools at once, and report the ones that failed
+    for tool, outcome in zip(tools, tool_client.create_many(tools)):
+        if not outcome.ok:
+            print(f"Could not create {tool['name']}: {outcome.error}")
 """
 
+import copy
 from abc import ABC
-from typing import Any, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import requests
+
+from .utils import (
+    CacheInfo,
+    ConnectionPool,
+    SingleFlight,
+    TTLCache,
+    get_connection_pool,
+    make_request,
+)
+from .utils.utils import validator_key
+
+ClientT = TypeVar("ClientT", bound="BaseClient")
+
+# Concurrent identical GETs of clients created with `coalesce=True` share one
+# request, across all clients of the process
+in_flight_gets = SingleFlight()
+
+
+def invalidated_by(client_url: str, url: str) -> Callable[[Hashable], bool]:
+    """Return a predicate matching the cache keys made stale by a write to `url`.
+
+    A write to a resource, or to one of its sub-resources, invalidates that
+    resource and everything below it. Any write invalidates the listings of
+    the collection.
+    """
+    resource_id = url[len(client_url) :].lstrip("/").split("/", 1)[0]
+    resource_url = f"{client_url}/{resource_id}" if resource_id else None
+
+    def predicate(key: Any) -> bool:
+        key_url = key[0]
+        if key_url == client_url:
+            return True
+        return resource_url is not None and (
+            key_url == resource_url or key_url.startswith(f"{resource_url}/")
+        )
+
+    return predicate
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one item of a bulk operation."""
+
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def bulk_results(response: Any, count: int) -> List[BulkResult]:
+    """Return the per-item results of a bulk endpoint's response.
+
+    Bulk endpoints answer with a list holding the result of each item, in
+    the order the items were sent.
+    """
+    if not isinstance(response, list) or len(response) != count:
+        error = ValueError(f"Expected a list of {count} results, got {response!r}")
+        return [BulkResult(error=error) for _ in range(count)]
+    return [BulkResult(result) for result in response]
+
+
+def keyed_items(pairs: Iterable[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+    """Return the bulk request body of `(resource_id, data)` pairs."""
+    return [{"id": resource_id, "data": data} for resource_id, data in pairs]
+
+
+def allowed_methods(headers: Mapping[str, str]) -> FrozenSet[str]:
+    """Return the methods listed in the `Allow` header of an OPTIONS response."""
+    return frozenset(
+        method.strip().upper()
+        for method in headers.get("Allow", "").split(",")
+        if method.strip()
+    )
+
+
+def page_params(page_size: int) -> Dict[str, Any]:
+    """Return the query parameters requesting the first page of a listing."""
+    return {"per_page": page_size}
+
+
+def split_page(
+    params: Dict[str, Any],
+    page: Any,
+) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+    """Split a listing response into its items and the parameters of the next page.
+
+    Paginated responses are objects holding the page's `items`, and either a
+    `next_cursor`, or a `has_next` flag with an optional `next_num` page
+    number. Any other response is taken as the complete, unpaginated listing.
+
+    Args:
+        params (dict): The query parameters the page was requested with.
+        page: The decoded response.
+
+    Returns:
+        tuple: The items of the page, and the query parameters of the next
+        page, or None if it was the last one.
+    """
+    if not isinstance(page, dict) or "items" not in page:
+        return list(page or []), None
+    next_params = {"per_page": params["per_page"]}
+    if page.get("next_cursor") is not None:
+        next_params["cursor"] = page["next_cursor"]
+    elif page.get("has_next"):
+        next_params["page"] = page.get("next_num") or params.get("page", 1) + 1
+    else:
+        return page["items"], None
+    return page["items"], next_params
 
-from .utils import make_request
+
+def run_concurrently(
+    calls: Sequence[Callable[[], Any]],
+    max_workers: int = 8,
+) -> List[BulkResult]:
+    """Run `calls` on at most `max_workers` threads and collect their outcomes."""
+
+    def run(call: Callable[[], Any]) -> BulkResult:
+        try:
+            return BulkResult(call())
+        except Exception as e:
+            return BulkResult(error=e)
+
+    max_workers = max(1, min(max_workers, len(calls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, calls))
 
 
 class BaseClient(ABC):
-    def __init__(self, base_url: str, resource: str):
+    def __init__(
+        self,
+        base_url: str,
+        resource: str,
+        pool: Optional[ConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
         self.base_url = base_url
         self.client_url = f"{base_url}/api/{resource}"
+        self.pool = pool if pool is not None else get_connection_pool(base_url)
+        self.cache = cache
+        self.validator_cache = validator_cache
+        self.coalesce = coalesce
+        self.bulk_url = f"{base_url}/api/bulk/{resource}"
+        # Methods allowed by each bulk endpoint, as advertised by the server
+        self._bulk_methods: Dict[str, FrozenSet[str]] = {}
+
+    def derive(self, client_class: Callable[..., ClientT]) -> ClientT:
+        """Return a `client_class` client sharing this client's pool and caches."""
+        return client_class(
+            self.base_url,
+            pool=self.pool,
+            cache=self.cache,
+            validator_cache=self.validator_cache,
+            coalesce=self.coalesce,
+        )
+
+    def _fetch(self, url: str, params=None):
+        def fetch():
+            return make_request(
+                "GET",
+                url,
+                params=params,
+                pool=self.pool,
+                validator_cache=self.validator_cache,
+            )
+
+        if not self.coalesce:
+            return fetch()
+        return in_flight_gets.do(validator_key(url, params), fetch)
+
+    def _request(self, method: str, url: str, data=None, params=None):
+        if method != "GET":
+            try:
+                return make_request(
+                    method,
+                    url,
+                    data=data,
+                    params=params,
+                    pool=self.pool,
+                )
+            finally:
+                self._invalidate(url)
+
+        if self.cache is None:
+            return self._fetch(url, params)
+
+        key = validator_key(url, params)
+        found, response = self.cache.lookup(key)
+        if not found:
+            generation = self.cache.generation
+            response = self._fetch(url, params)
+            self.cache.set(key, response, generation=generation)
+        # Callers own the returned data, so the cached copy stays pristine
+        return copy.deepcopy(response)
+
+    def _invalidate(self, *urls: str) -> None:
+        predicates = [invalidated_by(self.client_url, url) for url in urls]
+
+        def stale(key: Any) -> bool:
+            return key[0] == self.bulk_url or any(match(key) for match in predicates)
+
+        # GETs sent before the write must not be joined by the GETs after it
+        in_flight_gets.forget(stale)
+        if self.cache is not None:
+            self.cache.pop_matching(stale)
+
+    def _resource_urls(self, resource_ids: Iterable[str]) -> List[str]:
+        return [f"{self.client_url}/{resource_id}" for resource_id in resource_ids]
+
+    def _supports_bulk(self, url: str, method: str) -> bool:
+        """Return whether the server advertises `method` on the bulk endpoint `url`."""
+        methods = self._bulk_methods.get(url)
+        if methods is None:
+            try:
+                response = self.pool.request("OPTIONS", url)
+            except requests.RequestException:
+                # Try again on the next bulk call
+                return False
+            methods = frozenset()
+            if response.ok:
+                methods = allowed_methods(response.headers)
+            self._bulk_methods[url] = methods
+        return method in methods
+
+    def _bulk(
+        self,
+        method: str,
+        url: str,
+        calls: Sequence[Callable[[], Any]],
+        data=None,
+        params=None,
+        invalidates: Iterable[str] = (),
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Send a bulk request to `url`, or run `calls` concurrently without one."""
+        if not calls:
+            return []
+        if not self._supports_bulk(url, method):
+            return run_concurrently(calls, max_workers)
+
+        try:
+            if method == "GET":
+                response = self._fetch(url, params)
+            else:
+                try:
+                    response = make_request(
+                        method,
+                        url,
+                        data=data,
+                        params=params,
+                        pool=self.pool,
+                    )
+                finally:
+                    self._invalidate(self.client_url, *invalidates)
+        except Exception as e:
+            return [BulkResult(error=e) for _ in calls]
+        return bulk_results(response, len(calls))
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Return the response cache's hit and miss counters, if it has a cache."""
+        return self.cache.info() if self.cache is not None else None
 
     def create(self, data: Dict[str, Any]):
-        return make_request("POST", self.client_url, data=data)
+        return self._request("POST", self.client_url, data=data)
 
     def list(self):
-        return make_request("GET", self.client_url)
+        return self._request("GET", self.client_url)
+
+    def iter_list(self, page_size: int = 100, prefetch: bool = True) -> Iterator[Any]:
+        """Iterate over the collection one page at a time.
+
+        Servers that do not paginate return the whole collection on the first
+        request, which is then iterated over as is.
+
+        Args:
+            page_size (int): Number of items to request per page.
+            prefetch (bool): Whether to fetch the next page in the background
+                while the items of the current one are consumed.
+
+        Yields:
+            The items of the collection.
+        """
+        params = page_params(page_size)
+        if not prefetch:
+            next_params: Optional[Dict[str, Any]] = params
+            while next_params is not None:
+                params = next_params
+                items, next_params = split_page(
+                    params, self._request("GET", self.client_url, params=params)
+                )
+                yield from items
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future: Optional[Future] = executor.submit(
+                self._request, "GET", self.client_url, params=params
+            )
+            while future is not None:
+                items, next_params = split_page(params, future.result())
+                future = None
+                if next_params is not None:
+                    params = next_params
+                    future = executor.submit(
+                        self._request, "GET", self.client_url, params=params
+                    )
+                yield from items
+        finally:
+            executor.shutdown(wait=False)
 
     def get(self, resource_id: str):
         url = f"{self.client_url}/{resource_id}"
-        return make_request("GET", url)
+        return self._request("GET", url)
 
     def update(self, resource_id: str, data: Dict[str, Any]):
         url = f"{self.client_url}/{resource_id}"
-        return make_request("PUT", url, data=data)
+        return self._request("PUT", url, data=data)
 
     def delete(self, resource_id: str):
         url = f"{self.client_url}/{resource_id}"
-        return make_request("DELETE", url)
+        return self._request("DELETE", url)
+
+    def create_many(
+        self,
+        items: Iterable[Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Create several resources.
+
+        Args:
+            items (Iterable[dict]): The data of each resource.
+            max_workers (int): Maximum number of concurrent requests when the
+                server has no bulk endpoint.
+
+        Returns:
+            List[BulkResult]: The created resource, or the error, of each item.
+        """
+        items = list(items)
+        return self._bulk(
+            "POST",
+            self.bulk_url,
+            [partial(self.create, item) for item in items],
+            data=items,
+            max_workers=max_workers,
+        )
+
+    def get_many(
+        self,
+        resource_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Retrieve several resources, in the order of `resource_ids`."""
+        resource_ids = list(resource_ids)
+        return self._bulk(
+            "GET",
+            self.bulk_url,
+            [partial(self.get, resource_id) for resource_id in resource_ids],
+            params={"ids": ",".join(map(str, resource_ids))},
+            max_workers=max_workers,
+        )
+
+    def update_many(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Update several resources, given as a mapping of resource ID to data."""
+        pairs = list(updates.items())
+        return self._bulk(
+            "PUT",
+            self.bulk_url,
+            [partial(self.update, *pair) for pair in pairs],
+            data=keyed_items(pairs),
+            invalidates=self._resource_urls(updates),
+            max_workers=max_workers,
+        )
+
+    def delete_many(
+        self,
+        resource_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Delete several resources, in the order of `resource_ids`."""
+        resource_ids = list(resource_ids)
+        return self._bulk(
+            "DELETE",
+            self.bulk_url,
+            [partial(self.delete, resource_id) for resource_id in resource_ids],
+            data=resource_ids,
+            invalidates=self._resource_urls(resource_ids),
+            max_workers=max_workers,
+        )
 
 
 class AgentClient(BaseClient):
-    def __init__(self, base_url: str):
-        super().__init__(base_url, "agents")
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[ConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "agents", pool, cache, validator_cache, coalesce)
 
     def assign_tool_to_agent(self, agent_id: str, tool_data: Dict[str, Any]):
         url = f"{self.client_url}/{agent_id}/tools"
-        return make_request("POST", url, data=tool_data)
+        return self._request("POST", url, data=tool_data)
 
     def remove_tool_from_agent(self, agent_id: str, tool_data: Dict[str, Any]):
         url = f"{self.client_url}/{agent_id}/tools"
-        return make_request("DELETE", url, data=tool_data)
+        return self._request("DELETE", url, data=tool_data)
 
     def get_tools(self, agent_id: str):
         url = f"{self.client_url}/{agent_id}/tools"
-        return make_request("GET", url)
+        return self._request("GET", url)
 
     def add_relationship(self, agent_id: str, data: Dict[str, Any]):
         url = f"{self.client_url}/{agent_id}/relationships"
-        return make_request("POST", url, data=data)
+        return self._request("POST", url, data=data)
 
     def get_relationships(self, agent_id: str):
         url = f"{self.client_url}/{agent_id}/relationships"
-        return make_request("GET", url)
+        return self._request("GET", url)
 
     def remove_relationship(self, agent_id: str, related_agent_id: str):
         url = f"{self.client_url}/{agent_id}/relationships/{related_agent_id}"
-        return make_request("DELETE", url)
+        return self._request("DELETE", url)
+
+    def assign_tools(
+        self,
+        assignments: Iterable[Tuple[str, Dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Assign tools to agents, given as `(agent_id, tool_data)` pairs."""
+        assignments = list(assignments)
+        return self._bulk(
+            "POST",
+            f"{self.bulk_url}/tools",
+            [partial(self.assign_tool_to_agent, *pair) for pair in assignments],
+            data=keyed_items(assignments),
+            invalidates=self._resource_urls(id for id, _ in assignments),
+            max_workers=max_workers,
+        )
+
+    def add_relationships(
+        self,
+        relationships: Iterable[Tuple[str, Dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """Add relationships to agents, given as `(agent_id, data)` pairs."""
+        relationships = list(relationships)
+        return self._bulk(
+            "POST",
+            f"{self.bulk_url}/relationships",
+            [partial(self.add_relationship, *pair) for pair in relationships],
+            data=keyed_items(relationships),
+            invalidates=self._resource_urls(id for id, _ in relationships),
+            max_workers=max_workers,
+        )
 
 
 class FrameworkClient(BaseClient):
-    def __init__(self, base_url: str):
-        super().__init__(base_url, "frameworks")
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[ConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "frameworks", pool, cache, validator_cache, coalesce)
 
     def add_swarm_to_framework(
         self,
@@ -99,7 +578,7 @@ class FrameworkClient(BaseClient):
         swarm_data: Dict[str, Any],
     ):
         url = f"{self.client_url}/{framework_id}/swarms"
-        return make_request("POST", url, data=swarm_data)
+        return self._request("POST", url, data=swarm_data)
 
     def remove_swarm_from_framework(
         self,
@@ -107,26 +586,40 @@ class FrameworkClient(BaseClient):
         swarm_data: Dict[str, Any],
     ):
         url = f"{self.client_url}/{framework_id}/swarms"
-        return make_request("POST", url, data=swarm_data)
+        return self._request("POST", url, data=swarm_data)
 
     def add_tool_to_framework(self, framework_id: str, tool_data):
         url = f"{self.client_url}/{framework_id}/tools"
-        return make_request("POST", url, data=tool_data)
+        return self._request("POST", url, data=tool_data)
 
 
 class SwarmClient(BaseClient):
-    def __init__(self, base_url: str):
-        super().__init__(base_url, "swarms")
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[ConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "swarms", pool, cache, validator_cache, coalesce)
 
     def add_agent_to_swarm(self, swarm_id: str, agent_data: Dict[str, Any]):
         url = f"{self.client_url}/{swarm_id}/agents"
-        return make_request("POST", url, data=agent_data)
+        return self._request("POST", url, data=agent_data)
 
     def remove_agent_from_swarm(self, swarm_id: str, agent_data: Dict[str, Any]):
         url = f"{self.client_url}/{swarm_id}/agents"
-        return make_request("DELETE", url, data=agent_data)
+        return self._request("DELETE", url, data=agent_data)
 
 
 class ToolClient(BaseClient):
-    def __init__(self, base_url: str):
-        super().__init__(base_url, "tools")
+    def __init__(
+        self,
+        base_url: str,
+        pool: Optional[ConnectionPool] = None,
+        cache: Optional[TTLCache] = None,
+        validator_cache: Optional[TTLCache] = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, "tools", pool, cache, validator_cache, coalesce)
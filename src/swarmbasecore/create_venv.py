@@ -10,7 +10,12 @@ Key Functions:
   It checks if the directory already exists, raises an exception if it does, 
   and uses the venv module to create the environment. If a requirements file 
   is provided, it installs the specified packages using pip.
-
+- write_files: Writes a set of generated files under a directory, optionally
+  incrementally, skipping files whose content hash did not change and removing
+  files that are no longer generated.
+- write_files_atomically: Writes a set of generated files concurrently into a
+  new directory and switches a symbolic link over to it, so readers never
+  observe a half-written or missing export.
 
 Usage:
 To create a virtual environment, call the `create_virtualenv` function with 
@@ -23,15 +28,23 @@ Example:
     create_virtualenv(Path("my_env"), requirements_file=Path("requirements.txt"))
 """
 
+import hashlib
+import json
 import logging
+import os
+import shutil
 import subprocess
+import uuid
 import venv
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_FILE_NAME = ".swarmbase_manifest.json"
+
 
 # Function to create a virtual environment
 def create_virtualenv(env_dir: PathLike, requirements_file: Optional[Path] = None):
@@ -124,3 +137,263 @@ def write_file(file_path: Path, content: str) -> None:
     with file_path.open("w", encoding="utf-8") as f:
         f.write(content)
     logger.info(f"Wrote to file: {file_path}")
+
+
+class ExportSummary(NamedTuple):
+    """Relative paths of the files touched by `write_files`."""
+
+    written: List[Path]
+    skipped: List[Path]
+    removed: List[Path]
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of the content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _load_manifest(root: Path) -> Dict[str, str]:
+    manifest_path = root / MANIFEST_FILE_NAME
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _remove_file(root: Path, relative_path: Path) -> None:
+    """Remove a file and any parent directories it leaves empty."""
+    file_path = root / relative_path
+    file_path.unlink(missing_ok=True)
+    for parent in file_path.parents:
+        if parent == root or root not in parent.parents:
+            break
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+
+
+def _write_all(
+    root: Path,
+    files: Dict[Path, str],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Write files under root concurrently, creating their directories first."""
+    for directory in sorted({(root / relative_path).parent for relative_path in files}):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def write(item: Tuple[Path, str]) -> None:
+        relative_path, content = item
+        with (root / relative_path).open("w", encoding="utf-8") as f:
+            f.write(content)
+        logger.debug(f"Wrote to file: {root / relative_path}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(write, files.items()):
+            pass
+
+
+def _write_manifest(root: Path, files: Dict[Path, str]) -> Dict[str, str]:
+    manifest = {
+        relative_path.as_posix(): content_hash(content)
+        for relative_path, content in files.items()
+    }
+    (root / MANIFEST_FILE_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    return manifest
+
+
+def write_files(
+    root: Path,
+    files: Dict[Path, str],
+    incremental: bool = False,
+    max_workers: Optional[int] = None,
+) -> ExportSummary:
+    """Write generated files under a root directory.
+
+    A manifest with the content hash of every generated file is kept in the
+    root directory. In incremental mode, files whose hash matches the manifest
+    are skipped, and files listed in the manifest that are no longer generated
+    are removed.
+
+    Args:
+        root (Path):
+            The directory the files are written to.
+        files (Dict[Path, str]):
+            Maps paths relative to `root` to their content.
+        incremental (bool):
+            Whether to skip unchanged files and remove stale ones.
+        max_workers (Optional[int]):
+            Maximum number of threads writing files concurrently.
+
+    Returns:
+        ExportSummary: The files that were written, skipped and removed.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    previous = _load_manifest(root) if incremental else {}
+    summary = ExportSummary([], [], [])
+
+    changed: Dict[Path, str] = {}
+    for relative_path, content in files.items():
+        digest = previous.get(relative_path.as_posix())
+        if digest == content_hash(content) and (root / relative_path).is_file():
+            summary.skipped.append(relative_path)
+        else:
+            changed[relative_path] = content
+            summary.written.append(relative_path)
+    _write_all(root, changed, max_workers)
+
+    manifest = _write_manifest(root, files)
+    for key in sorted(previous.keys() - manifest.keys()):
+        _remove_file(root, Path(key))
+        summary.removed.append(Path(key))
+
+    logger.info(
+        f"Exported {root}: {len(summary.written)} written, "
+        f"{len(summary.skipped)} skipped, {len(summary.removed)} removed",
+    )
+    return summary
+
+
+def write_files_atomically(
+    root: Path,
+    files: Dict[Path, str],
+    max_workers: Optional[int] = None,
+) -> ExportSummary:
+    """Write generated files into a new directory and switch `root` over to it.
+
+    `root` is a symbolic link to the directory of the current export. All
+    files are written concurrently into a new sibling directory, then the
+    link is replaced in a single rename, so readers see either the previous
+    export or the new one, never a partial or missing one. Files of the
+    previous export that were not generated by an export, such as a virtual
+    environment or a module added to an agent's directory, are hard-linked
+    into the new directory first, or copied where hard links are not
+    supported. The previous export is left untouched until the switch, and
+    only removed after it.
+
+    A `root` that is still a plain directory, for example from an export
+    written by `write_files`, is converted to a link on the first call; only
+    that conversion leaves `root` briefly absent.
+
+    Args:
+        root (Path):
+            The directory the files are exported to.
+        files (Dict[Path, str]):
+            Maps paths relative to `root` to their content.
+        max_workers (Optional[int]):
+            Maximum number of threads writing files concurrently.
+
+    Returns:
+        ExportSummary: The files that were written and removed.
+    """
+    root.parent.mkdir(parents=True, exist_ok=True)
+    previous = _load_manifest(root)
+    current = root.resolve() if root.is_dir() else None
+    export_dir = root.with_name(f".{root.name}.{uuid.uuid4().hex}")
+    export_dir.mkdir()
+    carried_over: List[Path] = []
+    try:
+        _write_all(export_dir, files, max_workers)
+        manifest = _write_manifest(export_dir, files)
+        if current is not None:
+            generated = previous.keys() | manifest.keys() | {MANIFEST_FILE_NAME}
+            carried_over = _carry_over(current, export_dir, generated)
+        replaced = _swap_directory(export_dir, root)
+    except BaseException:
+        shutil.rmtree(export_dir, ignore_errors=True)
+        raise
+    # Only remove directories this function created, not the target of a link
+    # set up by hand
+    if (
+        replaced is not None
+        and replaced.parent == root.parent
+        and replaced.name.startswith(f".{root.name}.")
+    ):
+        shutil.rmtree(replaced, ignore_errors=True)
+
+    summary = ExportSummary(
+        list(files),
+        [],
+        [Path(key) for key in sorted(previous.keys() - manifest.keys())],
+    )
+    logger.info(
+        f"Exported {root}: {len(summary.written)} written, "
+        f"{len(summary.removed)} removed, {len(carried_over)} carried over",
+    )
+    return summary
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target, follow_symlinks=False)
+    except OSError:
+        shutil.copy2(source, target, follow_symlinks=False)
+
+
+def _carry_over(source: Path, target: Path, generated: Set[str]) -> List[Path]:
+    """Link the entries of source that no export generated into target.
+
+    Directories that hold no generated file are carried over whole, the
+    others are searched for the entries they hold. Source is not modified.
+
+    Returns:
+        List[Path]: The relative paths of the entries carried over.
+    """
+    generated_dirs = {
+        parent.as_posix() for key in generated for parent in Path(key).parents
+    }
+    carried: List[Path] = []
+
+    def visit(relative_dir: Path) -> None:
+        for entry in sorted((source / relative_dir).iterdir()):
+            relative_path = relative_dir / entry.name
+            key = relative_path.as_posix()
+            if key in generated:
+                continue
+            if key in generated_dirs and entry.is_dir() and not entry.is_symlink():
+                visit(relative_path)
+                continue
+            destination = target / relative_path
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.copytree(
+                    entry,
+                    destination,
+                    symlinks=True,
+                    copy_function=_link_or_copy,
+                )
+            else:
+                _link_or_copy(str(entry), str(destination))
+            carried.append(relative_path)
+
+    visit(Path())
+    return carried
+
+
+def _swap_directory(new: Path, target: Path) -> Optional[Path]:
+    """Point the target link at new, and return the directory it replaced."""
+    link = target.with_name(f".{target.name}.{uuid.uuid4().hex}.link")
+    os.symlink(new.name, link, target_is_directory=True)
+    try:
+        if target.is_symlink():
+            replaced: Optional[Path] = target.parent / os.readlink(target)
+            os.replace(link, target)
+        elif target.exists():
+            # A directory cannot be replaced by a link in one rename
+            replaced = target.with_name(f".{target.name}.{uuid.uuid4().hex}.old")
+            os.replace(target, replaced)
+            try:
+                os.replace(link, target)
+            except BaseException:
+                os.replace(replaced, target)
+                raise
+        else:
+            replaced = None
+            os.replace(link, target)
+    except BaseException:
+        link.unlink(missing_ok=True)
+        raise
+    return replaced
@@ -20,16 +20,49 @@ Example:
 
     creator = CreatorFactory.get_creator("swarmbasecore")
     creator.create_swarm_files(swarm, base_path=Path("./"))
+
+    # Later exports only rewrite what changed
+    summary = creator.create_swarm_files(swarm, base_path=Path("./"), incremental=True)
+
+    # Or publish the whole export at once, writing files on 16 threads
+    creator.create_swarm_files(swarm, base_path=Path("./"), atomic=True, max_workers=16)
 """
 
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Dict, Optional, Protocol
 
-from .create_venv import create_directory, create_virtualenv, write_file
+from .create_venv import (
+    ExportSummary,
+    create_virtualenv,
+    write_files,
+    write_files_atomically,
+)
 from .builders import Agent, Swarm, Tool
 from .utils import snake_case
 
 
+# Tool.extra_attributes that are rendered as LoggedBaseTool class attributes
+TOOL_CLASS_ATTRIBUTES = (
+    "cache_results",
+    "cache_maxsize",
+    "cache_ttl",
+    "cache_dir",
+    "run_timeout",
+    "max_concurrency",
+    "run_in_process",
+)
+
+# Swarm.extra_attributes that are rendered as SwarmyAgency keyword arguments
+AGENCY_ARGUMENTS = ("tool_workers", "tool_processes", "lazy_agents")
+
+# Swarm.extra_attributes that make the Swarm served by an AgencyPool, mapped
+# to the AgencyPool keyword arguments they set
+AGENCY_POOL_ARGUMENTS = {
+    "agency_pool_size": "size",
+    "agency_pool_max_waiting": "max_waiting",
+}
+
+
 class FrameworkCreator(Protocol):
     """Generic interface for swarm framework.
 
@@ -40,7 +73,9 @@ class FrameworkCreator(Protocol):
         swarm_as_string(swarm: Swarm) -> str: Generate a string representation of the Swarm.
         agent_as_string(agent: Agent) -> str: Generate a string representation of an Agent.
         tool_as_string(tool: Tool) -> str: Generate a string representation of a Tool.
-        create_swarm_files(swarm: Swarm, base_path: Path) -> None: Create files for the Swarm.
+        swarm_files(swarm: Swarm) -> Dict[Path, str]: Generate the files for the Swarm.
+        create_swarm_files(swarm: Swarm, base_path: Path, ...) -> ExportSummary:
+            Create files for the Swarm.
     """
 
     @classmethod
@@ -53,7 +88,49 @@ class FrameworkCreator(Protocol):
     def tool_as_string(tool: Tool) -> str: ...
 
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: ...
+    def swarm_files(cls, swarm: Swarm) -> Dict[Path, str]: ...
+
+    @classmethod
+    def create_swarm_files(
+        cls,
+        swarm: Swarm,
+        base_path: Path,
+        incremental: bool = False,
+        atomic: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> ExportSummary:
+        """Create the directory structure and files for the Swarm and its agents/tools.
+
+        Args:
+            swarm (Swarm): The Swarm object for which files are created.
+            base_path (Path): The base path where the files will be created.
+            incremental (bool): Whether to write only the files whose content
+                changed since the previous export and remove the files of
+                agents and tools that no longer exist.
+            atomic (bool): Whether to write the export into a new directory
+                and switch the swarm directory, a symbolic link, over to it
+                once complete.
+            max_workers (Optional[int]): Maximum number of threads writing
+                files concurrently.
+
+        Returns:
+            ExportSummary: The files that were written, skipped and removed.
+
+        Raises:
+            ValueError: If both `incremental` and `atomic` are requested.
+        """
+        swarm_path = base_path / swarm.instance_name
+        files = cls.swarm_files(swarm)
+        if atomic:
+            if incremental:
+                raise ValueError("Atomic exports cannot be incremental.")
+            return write_files_atomically(swarm_path, files, max_workers=max_workers)
+        return write_files(
+            swarm_path,
+            files,
+            incremental=incremental,
+            max_workers=max_workers,
+        )
 
     @staticmethod
     def setup_virtualenv(swarm_name: str, requirements_file: Optional[Path]) -> None:
@@ -79,7 +156,7 @@ class SwarmBaseCreator(FrameworkCreator):
         swarm_as_string(swarm: Swarm) -> str: Generate a string representation of the Swarm.
         agent_as_string(agent: Agent) -> str: Generate a string representation of an Agent.
         tool_as_string(tool: Tool) -> str: Generate a string representation of a Tool.
-        create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: Create files for the Swarm.
+        swarm_files(cls, swarm: Swarm) -> Dict[Path, str]: Generate the files for the Swarm.
     """
 
     @staticmethod
@@ -93,10 +170,9 @@ class SwarmBaseCreator(FrameworkCreator):
             str: The formatted string representing the Swarm.
         """
         agency_relationships = []
-        if swarm.agency_chart.manager_agent:
-            agency_relationships.append(
-                swarm.agents[swarm.agency_chart.manager_agent].instance_name,
-            )
+        manager_agent = swarm.agency_chart.manager_agent
+        if manager_agent:
+            agency_relationships.append(swarm.agents[manager_agent].instance_name)
 
         for source, targets in swarm.agency_chart.graph.items():
             source_agent = snake_case(swarm.agents[source].instance_name)
@@ -110,16 +186,45 @@ class SwarmBaseCreator(FrameworkCreator):
         )
 
         agents_init = "\n".join(
-            f"{agent.instance_name} = {agent.class_name}()"
+            f"    {agent.instance_name} = {agent.class_name}()"
             for agent in swarm.agents.values()
         )
 
-        return f"""from swarmbasecore.agency_swarm_framework import SwarmyAgency
-{agents_imports}
+        extra_attributes = swarm.extra_attributes or {}
+        agency_arguments = "".join(
+            f", {name}={extra_attributes[name]!r}"
+            for name in AGENCY_ARGUMENTS
+            if name in extra_attributes
+        )
 
+        # Each agency gets its own agents, so that pooled instances share no state
+        factory = f"""def create_{swarm.instance_name}():
 {agents_init}
+    return SwarmyAgency({str(agency_relationships).replace("'", "")}{agency_arguments})
+"""
+
+        if "agency_pool_size" not in extra_attributes:
+            return f"""from swarmbasecore.agency_swarm_framework import SwarmyAgency
+{agents_imports}
 
-{swarm.instance_name} = SwarmyAgency({str(agency_relationships).replace("'", "")})
+
+{factory}
+
+{swarm.instance_name} = create_{swarm.instance_name}()
+"""
+
+        pool_arguments = "".join(
+            f", {argument}={extra_attributes[name]!r}"
+            for name, argument in AGENCY_POOL_ARGUMENTS.items()
+            if name in extra_attributes
+        )
+        return f"""from swarmbasecore.agency_swarm_framework import AgencyPool, SwarmyAgency
+{agents_imports}
+
+
+{factory}
+
+{swarm.instance_name} = AgencyPool(create_{swarm.instance_name}{pool_arguments})
 """
 
     @staticmethod
@@ -163,23 +268,28 @@ class SwarmBaseCreator(FrameworkCreator):
             str: The formatted string representing the Tool.
         """
         tool_description = f'"""{tool.description}"""' if tool.description else ""
+        extra_attributes = tool.extra_attributes or {}
+        tool_attributes = "".join(
+            f"\n    {name} = {extra_attributes[name]!r}"
+            for name in TOOL_CLASS_ATTRIBUTES
+            if name in extra_attributes
+        )
         return f"""from swarmbasecore.agency_swarm_framework import LoggedBaseTool
 class {tool.class_name}(LoggedBaseTool):
-    {tool_description}
+    {tool_description}{tool_attributes}
     {tool.code}
     """
 
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None:
-        """Create the directory structure and files for the Swarm and its agents/tools.
+    def swarm_files(cls, swarm: Swarm) -> Dict[Path, str]:
+        """Generate the files for the Swarm and its agents/tools.
 
         Args:
-            swarm (Swarm): The Swarm object for which files are created.
-            base_path (Path): The base path where the files will be created.
-        """
-        swarm_path = base_path / swarm.instance_name
-        create_directory(swarm_path)
+            swarm (Swarm): The Swarm object for which files are generated.
 
+        Returns:
+            Dict[Path, str]: Maps paths relative to the swarm directory to their content.
+        """
         # Create __main__.py for the Swarm
         main_content = f"""from {swarm.instance_name} import {swarm.instance_name}
 
@@ -193,31 +303,28 @@ origins = [
 
 {swarm.instance_name}.serve_agency(origins)
 """
-        write_file(swarm_path / "__main__.py", main_content)
-        write_file(swarm_path / f"{swarm.instance_name}.py", cls.swarm_as_string(swarm))
+        files = {
+            Path("__main__.py"): main_content,
+            Path(f"{swarm.instance_name}.py"): cls.swarm_as_string(swarm),
+        }
 
         # Create agents' directories and files
         for agent in swarm.agents.values():
-            agent_path = swarm_path / "agents" / agent.class_name
-            create_directory(agent_path)
-            write_file(
-                agent_path / "__init__.py",
-                f"from agents.{agent.class_name} import {agent.class_name}",
-            )
-            write_file(
-                agent_path / f"{agent.class_name}.py",
-                cls.agent_as_string(agent),
+            agent_path = Path("agents") / agent.class_name
+            files[agent_path / "__init__.py"] = (
+                f"from agents.{agent.class_name} import {agent.class_name}"
             )
+            files[agent_path / f"{agent.class_name}.py"] = cls.agent_as_string(agent)
 
         # Create tools' directories and files
         for tool in swarm.tools.values():
-            tool_path = swarm_path / "tools" / tool.instance_name
-            create_directory(tool_path)
-            write_file(
-                tool_path / "__init__.py",
-                f"from .{tool.instance_name} import {tool.class_name}",
+            tool_path = Path("tools") / tool.instance_name
+            files[tool_path / "__init__.py"] = (
+                f"from .{tool.instance_name} import {tool.class_name}"
             )
-            write_file(tool_path / f"{tool.instance_name}.py", cls.tool_as_string(tool))
+            files[tool_path / f"{tool.instance_name}.py"] = cls.tool_as_string(tool)
+
+        return files
 
 
 # %%
@@ -231,7 +338,7 @@ class LangchainCreator(FrameworkCreator):
         swarm_as_string(swarm: Swarm) -> str: Generate a string representation of the Swarm.
         agent_as_string(agent: Agent) -> str: Generate a string representation of an Agent.
         tool_as_string(tool: Tool) -> str: Generate a string representation of a Tool.
-        create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: Create files for the Swarm.
+        swarm_files(cls, swarm: Swarm) -> Dict[Path, str]: Generate the files for the Swarm.
     """
 
     @staticmethod
@@ -354,16 +461,15 @@ def {agent.instance_name}(state):
         return ""
 
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None:
-        """Create the directory structure and files for the Swarm and its agents/tools.
+    def swarm_files(cls, swarm: Swarm) -> Dict[Path, str]:
+        """Generate the files for the Swarm and its agents/tools.
 
         Args:
-            swarm (Swarm): The Swarm object for which files are created.
-            base_path (Path): The base path where the files will be created.
-        """
-        swarm_path = base_path / swarm.instance_name
-        create_directory(swarm_path)
+            swarm (Swarm): The Swarm object for which files are generated.
 
+        Returns:
+            Dict[Path, str]: Maps paths relative to the swarm directory to their content.
+        """
         # Create __main__.py for the Swarm
         main_content = f"""from {swarm.instance_name} import {swarm.instance_name}
 
@@ -375,31 +481,28 @@ for s in {swarm.instance_name}.stream(
         print(s)
         print("----")
 """
-        write_file(swarm_path / "__main__.py", main_content)
-        write_file(swarm_path / f"{swarm.instance_name}.py", cls.swarm_as_string(swarm))
+        files = {
+            Path("__main__.py"): main_content,
+            Path(f"{swarm.instance_name}.py"): cls.swarm_as_string(swarm),
+        }
 
         # Create agents' directories and files
         for agent in swarm.agents.values():
-            agent_path = swarm_path / "agents" / agent.instance_name
-            create_directory(agent_path)
-            write_file(
-                agent_path / "__init__.py",
-                f"from agents.{agent.instance_name} import {agent.instance_name}",
-            )
-            write_file(
-                agent_path / f"{agent.instance_name}.py",
-                cls.agent_as_string(agent),
+            agent_path = Path("agents") / agent.instance_name
+            files[agent_path / "__init__.py"] = (
+                f"from agents.{agent.instance_name} import {agent.instance_name}"
             )
+            files[agent_path / f"{agent.instance_name}.py"] = cls.agent_as_string(agent)
 
         # Create tools' directories and files
         for tool in swarm.tools.values():
-            tool_path = swarm_path / "tools" / tool.instance_name
-            create_directory(tool_path)
-            write_file(
-                tool_path / "__init__.py",
-                f"from .{tool.instance_name} import {tool.class_name}",
+            tool_path = Path("tools") / tool.instance_name
+            files[tool_path / "__init__.py"] = (
+                f"from .{tool.instance_name} import {tool.class_name}"
             )
-            write_file(tool_path / f"{tool.instance_name}.py", cls.tool_as_string(tool))
+            files[tool_path / f"{tool.instance_name}.py"] = cls.tool_as_string(tool)
+
+        return files
 
 
 class CreatorFactory:
@@ -1,5 +1,261 @@
+"""swarmbasecore.logging_utils
+
+This module configures the loggers used by the agency_swarm wrappers.
+
+By default, every logger writes synchronously to its own log file and to the
+console. After `enable_queue_logging` is called, loggers only enqueue their
+records, and a single background thread drains the queue into the same sinks
+in batches, flushing each sink once per batch. Log I/O then stays off the
+request path.
+
+Handlers are shared through a registry: calling `setup_logger` again for the
+same logger reuses its handlers, all loggers share one console handler, and
+at most `HandlerRegistry.max_open_files` log files are kept open at once; the
+least recently used file is closed and transparently reopened on its next
+record.
+
+Example:
+    from swarmbasecore.logging_utils import enable_queue_logging, setup_logger
+
+    enable_queue_logging(batch_size=256)
+    logger = setup_logger("LoggedAgent", "CEO")
+    logger.info("Queued, written by the background listener")
+"""
+
+import atexit
 import logging
-from typing import Optional
+import queue
+import threading
+from collections import OrderedDict, defaultdict
+from logging.handlers import QueueHandler
+from typing import Dict, List, Optional
+
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _DeferredFlushMixin:
+    """Let the queue listener flush a sink once per batch instead of per record."""
+
+    defer_flush = False
+
+    def flush(self):
+        if not self.defer_flush:
+            super().flush()
+
+
+class _FileHandler(_DeferredFlushMixin, logging.FileHandler):
+    def __init__(self, filename: str, registry: "HandlerRegistry"):
+        super().__init__(filename, delay=True)
+        self.registry = registry
+
+    def emit(self, record):
+        self.registry.touch(self)
+        super().emit(record)
+
+    def release_stream(self) -> bool:
+        """Close the file until the next record, unless it is being written."""
+        lock = self.lock
+        if lock is None or not lock.acquire(blocking=False):
+            return False
+        try:
+            if self.stream is not None:
+                stream, self.stream = self.stream, None
+                stream.flush()
+                stream.close()
+        finally:
+            lock.release()
+        return True
+
+
+class _StreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+
+class HandlerRegistry:
+    """Shared handlers per log destination, with a bound on open log files.
+
+    Args:
+        max_open_files (int): Maximum number of log files kept open at once.
+    """
+
+    def __init__(self, max_open_files: int = 64):
+        self.max_open_files = max_open_files
+        self._lock = threading.Lock()
+        self._file_handlers: Dict[str, _FileHandler] = {}
+        self._open_files: "OrderedDict[_FileHandler, None]" = OrderedDict()
+        self._console_handler: Optional[_StreamHandler] = None
+
+    def file_handler(self, filename: str) -> logging.Handler:
+        """Return the handler writing to `filename`, creating it if needed."""
+        with self._lock:
+            handler = self._file_handlers.get(filename)
+            if handler is None:
+                handler = _FileHandler(filename, self)
+                handler.setLevel(logging.INFO)
+                handler.setFormatter(logging.Formatter(FORMAT))
+                self._file_handlers[filename] = handler
+            return handler
+
+    def console_handler(self) -> logging.Handler:
+        """Return the console handler shared by all loggers."""
+        with self._lock:
+            if self._console_handler is None:
+                self._console_handler = _StreamHandler()
+                self._console_handler.setLevel(logging.INFO)
+                self._console_handler.setFormatter(logging.Formatter(FORMAT))
+            return self._console_handler
+
+    def touch(self, handler: _FileHandler) -> None:
+        """Mark the handler's file as used, closing the least recently used ones."""
+        with self._lock:
+            self._open_files[handler] = None
+            self._open_files.move_to_end(handler)
+            victims = []
+            while len(self._open_files) > max(self.max_open_files, 1):
+                victim, _ = self._open_files.popitem(last=False)
+                if victim is not handler:
+                    victims.append(victim)
+
+        # Handler locks are taken outside of the registry lock, and never
+        # waited for, so that two writers cannot deadlock evicting each other.
+        busy = [victim for victim in victims if not victim.release_stream()]
+        if busy:
+            with self._lock:
+                for victim in busy:
+                    self._open_files[victim] = None
+                    self._open_files.move_to_end(victim, last=False)
+
+    @property
+    def open_files(self) -> int:
+        """Number of log files currently tracked as open."""
+        return len(self._open_files)
+
+
+handler_registry = HandlerRegistry()
+
+
+class BatchingQueueListener:
+    """Drain log records from a queue into per-logger sinks on a background thread.
+
+    Args:
+        log_queue (queue.SimpleQueue): The queue the loggers enqueue records into.
+        batch_size (int): Maximum number of records handled between flushes.
+    """
+
+    _sentinel = None
+
+    def __init__(self, log_queue: queue.SimpleQueue, batch_size: int = 100):
+        self.queue = log_queue
+        self.batch_size = batch_size
+        self.sinks: Dict[str, List[logging.Handler]] = defaultdict(list)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._monitor,
+            name="swarmbasecore-log-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Handle every queued record, then stop the background thread."""
+        if self._thread is not None:
+            self.queue.put(self._sentinel)
+            self._thread.join()
+            self._thread = None
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = self._sentinel in batch
+            self.handle_batch([record for record in batch if record is not None])
+            if stop:
+                return
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        touched = {
+            handler for record in records for handler in self.sinks.get(record.name, ())
+        }
+        deferred = [
+            handler for handler in touched if isinstance(handler, _DeferredFlushMixin)
+        ]
+        for sink in deferred:
+            sink.defer_flush = True
+        try:
+            for record in records:
+                for handler in self.sinks.get(record.name, ()):
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+        finally:
+            for sink in deferred:
+                sink.defer_flush = False
+            for handler in touched:
+                handler.flush()
+
+
+_lock = threading.RLock()
+_managed_loggers: Dict[str, logging.Logger] = {}
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[BatchingQueueListener] = None
+
+
+def _attach(logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+    if _listener is not None and _queue_handler is not None:
+        _listener.sinks[logger.name].extend(handlers)
+        if _queue_handler not in logger.handlers:
+            logger.addHandler(_queue_handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+
+def enable_queue_logging(batch_size: int = 100) -> None:
+    """Route every swarmbasecore logger through a queue and a background listener.
+
+    Loggers that were already set up are switched over as well. Calling it
+    again while queue logging is enabled has no effect.
+
+    Args:
+        batch_size (int): Maximum number of records written between flushes.
+    """
+    global _queue_handler, _listener
+    with _lock:
+        if _listener is not None:
+            return
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _listener = BatchingQueueListener(log_queue, batch_size=batch_size)
+        for logger in _managed_loggers.values():
+            handlers = logger.handlers[:]
+            for handler in handlers:
+                logger.removeHandler(handler)
+            _attach(logger, handlers)
+        _listener.start()
+
+
+def disable_queue_logging() -> None:
+    """Write out queued records and attach the sinks to their loggers again."""
+    global _queue_handler, _listener
+    with _lock:
+        if _listener is None or _queue_handler is None:
+            return
+        listener, queue_handler = _listener, _queue_handler
+        for logger in _managed_loggers.values():
+            logger.removeHandler(queue_handler)
+        listener.stop()
+        _listener = _queue_handler = None
+        for logger in _managed_loggers.values():
+            _attach(logger, listener.sinks.get(logger.name, []))
+
+
+atexit.register(disable_queue_logging)
 
 
 def setup_logger(class_name: str, name: Optional[str] = None):
@@ -16,25 +272,20 @@ def setup_logger(class_name: str, name: Optional[str] = None):
     else:
         log_name = "log"
 
-    file_handler = logging.FileHandler(
-        (
-            f"{class_name}_{name}_{log_name}.log"
-            if name
-            else f"{class_name}_{log_name}.log"
-        ),
-    )
-    file_handler.setLevel(logging.INFO)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    with _lock:
+        if logger.name in _managed_loggers:
+            return logger
+
+        file_handler = handler_registry.file_handler(
+            (
+                f"{class_name}_{name}_{log_name}.log"
+                if name
+                else f"{class_name}_{log_name}.log"
+            ),
+        )
+        console_handler = handler_registry.console_handler()
+
+        _managed_loggers[logger.name] = logger
+        _attach(logger, [file_handler, console_handler])
 
     return logger
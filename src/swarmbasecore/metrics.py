@@ -0,0 +1,215 @@
+"""swarmbasecore.metrics
+
+This module provides an in-process registry of call metrics for the
+agency_swarm wrappers. `LoggedBaseTool` and `LoggedAgent` record, per class
+and method, the number of calls, the number of calls that raised, and a
+latency histogram.
+
+Recording is opt-in: nothing is recorded, and instrumented calls skip the
+timing altogether, until `enable_metrics` is called. Recording is lock-free:
+each thread updates its own shard of counters, and shards are only merged when
+the metrics are read.
+
+Key Classes:
+- MetricsRegistry: Records call latencies and exposes them through
+  `snapshot` and in the Prometheus text format through `to_prometheus`.
+- CallStats: Aggregated metrics of one instrumented method.
+
+Key Functions:
+- enable_metrics: Start recording call metrics in `metrics`.
+- disable_metrics: Stop recording call metrics.
+
+Example:
+    from swarmbasecore.metrics import enable_metrics, metrics
+
+    enable_metrics()
+    ...
+    for (kind, name, method), stats in metrics.snapshot().items():
+        print(kind, name, method, stats.calls, stats.errors, stats.mean)
+
+    print(metrics.to_prometheus())
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+MetricKey = Tuple[str, str, str]
+
+
+@dataclass
+class CallStats:
+    """Metrics of one instrumented method.
+
+    `buckets` holds the number of calls per histogram bucket (not cumulative),
+    with a last entry for calls slower than the largest bound.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    buckets: List[int] = field(default_factory=list)
+
+    @property
+    def mean(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class MetricsRegistry:
+    """Registry of per-class call counts, error counts and latency histograms.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds, in seconds, of the histogram buckets.
+        enabled (bool): Whether instrumented calls are recorded.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        enabled: bool = False,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.enabled = enabled
+        # Shards are keyed by thread identifier; an identifier is only reused
+        # once its thread has exited, so each shard has a single writer.
+        self._shards: Dict[int, Dict[MetricKey, List[float]]] = {}
+        self._shards_lock = threading.Lock()
+
+    def _new_shard(self) -> Dict[MetricKey, List[float]]:
+        with self._shards_lock:
+            return self._shards.setdefault(threading.get_ident(), {})
+
+    def observe(
+        self,
+        kind: str,
+        name: str,
+        method: str,
+        seconds: float,
+        error: bool = False,
+    ) -> None:
+        """Record one call of `method` of the `kind` class called `name`."""
+        shard = self._shards.get(threading.get_ident()) or self._new_shard()
+        key = (kind, name, method)
+        # [calls, errors, total seconds, bucket counts...]
+        stats = shard.get(key)
+        if stats is None:
+            stats = shard[key] = [0, 0, 0.0] + [0] * (len(self.buckets) + 1)
+        stats[0] += 1
+        stats[2] += seconds
+        if error:
+            stats[1] += 1
+        stats[3 + bisect.bisect_left(self.buckets, seconds)] += 1
+
+    def snapshot(self) -> Dict[MetricKey, CallStats]:
+        """Return the metrics of every thread merged per (kind, name, method)."""
+        with self._shards_lock:
+            shards = list(self._shards.values())
+
+        merged: Dict[MetricKey, CallStats] = {}
+        for shard in shards:
+            for key, stats in list(shard.items()):
+                calls, errors, seconds, *counts = list(stats)
+                total = merged.get(key)
+                if total is None:
+                    total = merged[key] = CallStats(
+                        buckets=[0] * (len(self.buckets) + 1),
+                    )
+                total.calls += int(calls)
+                total.errors += int(errors)
+                total.total_seconds += seconds
+                for i, count in enumerate(counts):
+                    total.buckets[i] += int(count)
+        return merged
+
+    def reset(self) -> None:
+        """Forget every recorded metric."""
+        with self._shards_lock:
+            for shard in self._shards.values():
+                shard.clear()
+
+    def to_prometheus(self, prefix: str = "swarmbase") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = sorted(self.snapshot().items())
+        lines = [
+            f"# HELP {prefix}_calls_total Number of calls.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines.extend(
+            f"{prefix}_calls_total{{{_labels(key)}}} {stats.calls}"
+            for key, stats in snapshot
+        )
+        lines.extend(
+            [
+                f"# HELP {prefix}_errors_total Number of calls that raised an exception.",
+                f"# TYPE {prefix}_errors_total counter",
+            ],
+        )
+        lines.extend(
+            f"{prefix}_errors_total{{{_labels(key)}}} {stats.errors}"
+            for key, stats in snapshot
+        )
+        lines.extend(
+            [
+                f"# HELP {prefix}_call_duration_seconds Call latency.",
+                f"# TYPE {prefix}_call_duration_seconds histogram",
+            ],
+        )
+        for key, stats in snapshot:
+            labels = _labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, stats.buckets):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_call_duration_seconds_bucket{{{labels},le="{bound}"}} '
+                    f"{cumulative}",
+                )
+            lines.append(
+                f'{prefix}_call_duration_seconds_bucket{{{labels},le="+Inf"}} '
+                f"{stats.calls}",
+            )
+            lines.append(
+                f"{prefix}_call_duration_seconds_sum{{{labels}}} {stats.total_seconds}",
+            )
+            lines.append(f"{prefix}_call_duration_seconds_count{{{labels}}} {stats.calls}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: MetricKey) -> str:
+    kind, name, method = key
+    return (
+        f'kind="{_escape(kind)}",name="{_escape(name)}",method="{_escape(method)}"'
+    )
+
+
+metrics = MetricsRegistry()
+
+
+def enable_metrics() -> None:
+    """Record the calls of instrumented tools and agents in `metrics`."""
+    metrics.enabled = True
+
+
+def disable_metrics() -> None:
+    """Stop recording calls; the metrics recorded so far are kept."""
+    metrics.enabled = False
@@ -1,5 +1,11 @@
+from .cache import CacheInfo, TTLCache
+from .singleflight import AsyncSingleFlight, SingleFlight
 from .utils import (
+    ConnectionPool,
     RelationshipType,
+    ValidatedResponse,
+    close_connection_pools,
+    get_connection_pool,
     make_request,
     AgentRelationship,
     snake_case,
@@ -7,7 +13,15 @@ from .utils import (
 )
 
 __all__ = [
+    "CacheInfo",
+    "TTLCache",
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "ConnectionPool",
     "RelationshipType",
+    "ValidatedResponse",
+    "close_connection_pools",
+    "get_connection_pool",
     "make_request",
     "AgentRelationship",
     "snake_case",
@@ -0,0 +1,96 @@
+"""swarmbasecore.utils.cache
+
+This module provides a small thread-safe in-memory cache with least recently
+used eviction and an optional time to live, used to memoize tool results and
+API responses.
+
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: Optional[int]
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    `generation` is incremented by every invalidation, so that a value
+    computed before an invalidation can be kept out of the cache with
+    `set(key, value, generation=...)`.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries, unbounded if None.
+        ttl (float, optional): Seconds an entry stays valid, forever if None.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return whether `key` is cached and its value, counting a hit or a miss."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        found, value = self.lookup(key)
+        return value if found else default
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store `value`, unless the cache was invalidated since `generation`."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove `key` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every key for which `predicate` is true, returning how many."""
+        with self._lock:
+            self.generation += 1
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._data), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._data)
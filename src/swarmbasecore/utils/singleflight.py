@@ -0,0 +1,146 @@
+"""swarmbasecore.utils.singleflight
+
+This module provides request coalescing: while a call for a key is in flight,
+further calls for the same key wait for it and share its result instead of
+starting their own.
+
+Callers that join an in-flight call receive a deep copy of the result, so no
+two callers share mutable data. If the call raises, every waiting caller
+raises the same exception. `forget` stops later callers from joining the
+calls in flight, for example once a write made their results stale.
+
+"""
+
+import asyncio
+import copy
+import threading
+import weakref
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key across threads."""
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return `fn()`, or the result of the in-flight call for `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Let later calls whose key matches `predicate` start a call of their own.
+
+        Callers already waiting for those calls still receive their results.
+        """
+        with self._lock:
+            for key in [key for key in self._calls if predicate(key)]:
+                del self._calls[key]
+
+
+class _AsyncCall:
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent calls with the same key within each event loop.
+
+    The call runs as a task of its own, so a caller that is cancelled does
+    not cancel it for the others; it is only cancelled once every caller
+    waiting for it has been cancelled.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        # Held briefly by every event loop, so that `forget` can be called
+        # from any thread
+        self._lock = threading.Lock()
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _AsyncCall]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return `await fn()`, or the result of the in-flight call for `key`."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._calls.setdefault(loop, {})
+            call = calls.get(key)
+            leader = call is None
+            if call is None:
+                call = calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+                call.task.add_done_callback(partial(self._done, calls, key, call))
+                self.calls += 1
+            else:
+                self.shared += 1
+            call.waiters += 1
+
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            with self._lock:
+                call.waiters -= 1
+                abandoned = not call.waiters and not call.task.done()
+            if abandoned:
+                call.task.cancel()
+        return result if leader else copy.deepcopy(result)
+
+    def _done(
+        self,
+        calls: Dict[Hashable, _AsyncCall],
+        key: Hashable,
+        call: _AsyncCall,
+        task: "asyncio.Future[Any]",
+    ) -> None:
+        with self._lock:
+            if calls.get(key) is call:
+                del calls[key]
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Let later calls whose key matches `predicate` start a call of their own.
+
+        Applies to the calls in flight on every event loop. Callers already
+        waiting for those calls still receive their results.
+        """
+        with self._lock:
+            for calls in self._calls.values():
+                for key in [key for key in calls if predicate(key)]:
+                    del calls[key]
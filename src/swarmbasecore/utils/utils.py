@@ -5,10 +5,14 @@ within the SwarmBase Core framework.
 
 """
 
+import copy
+import threading
+import time
 from re import sub, split
-from typing import NamedTuple
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 
 
 def snake_case(s):
@@ -57,7 +61,168 @@ class AgentRelationship(NamedTuple):
     target_agent_id: str
 
 
-def make_request(method, url, headers=None, data=None, params=None):
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections.
+
+    Wraps a single ``requests.Session`` whose adapters keep up to
+    ``pool_maxsize`` connections open per host. When the pool has been idle
+    for longer than ``idle_timeout`` seconds, the session is closed and its
+    connections are dropped; a fresh session is created on the next request.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to cache.
+        pool_maxsize (int): Maximum number of connections kept per host.
+        pool_block (bool): Whether to block when no free connection is available
+            instead of opening a throwaway one.
+        max_retries (int): Number of retries for failed connection attempts.
+        idle_timeout (float, optional): Seconds of inactivity after which
+            idle connections are evicted. ``None`` disables eviction.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_retries: int = 0,
+        idle_timeout: Optional[float] = 60.0,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._last_used = 0.0
+        self._in_flight = 0
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _acquire(self) -> requests.Session:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and self.idle_timeout is not None
+                and not self._in_flight
+                and now - self._last_used > self.idle_timeout
+            ):
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._new_session()
+            self._in_flight += 1
+            self._last_used = now
+            return self._session
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """Send a request through a pooled keep-alive connection."""
+        session = self._acquire()
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            self._release()
+
+    def close(self) -> None:
+        """Close all connections held by the pool."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_connection_pools: Dict[str, ConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def get_connection_pool(base_url: str, **pool_kwargs) -> ConnectionPool:
+    """Return the connection pool shared by all clients of ``base_url``.
+
+    The pool is created on first use with ``pool_kwargs``; later calls for the
+    same ``base_url`` return the existing pool and ignore ``pool_kwargs``.
+
+    Args:
+        base_url (str): The base URL of the API.
+        **pool_kwargs: Arguments forwarded to ``ConnectionPool``.
+
+    Returns:
+        ConnectionPool: The shared pool for ``base_url``.
+    """
+    with _connection_pools_lock:
+        pool = _connection_pools.get(base_url)
+        if pool is None:
+            pool = _connection_pools[base_url] = ConnectionPool(**pool_kwargs)
+        return pool
+
+
+def close_connection_pools() -> None:
+    """Close and forget every shared connection pool."""
+    with _connection_pools_lock:
+        for pool in _connection_pools.values():
+            pool.close()
+        _connection_pools.clear()
+
+
+class ValidatedResponse(NamedTuple):
+    """A decoded response body with the validators needed to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+
+def validator_key(url: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+    """Return the key of a GET request in the response and validator caches."""
+    return (url, tuple(sorted((params or {}).items())))
+
+
+def conditional_headers(cached: ValidatedResponse) -> Dict[str, str]:
+    """Return the headers turning a GET into a revalidation of `cached`."""
+    headers = {}
+    if cached.etag is not None:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified is not None:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def validated_response(
+    headers: Mapping[str, str],
+    data: Any,
+) -> Optional[ValidatedResponse]:
+    """Return `data` with the response's validators, or None if it has none."""
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return None
+    return ValidatedResponse(etag, last_modified, data)
+
+
+def make_request(
+    method,
+    url,
+    headers=None,
+    data=None,
+    params=None,
+    pool=None,
+    validator_cache=None,
+):
     """Make an HTTP request.
 
     Args:
@@ -66,21 +231,41 @@ def make_request(method, url, headers=None, data=None, params=None):
         headers (dict, optional): Additional headers to include in the request.
         data (dict, optional): The data to send in the request body.
         params (dict, optional): URL parameters to include in the request.
+        pool (ConnectionPool, optional): Connection pool to send the request
+            through. Without it, a new connection is opened for the request.
+        validator_cache (TTLCache, optional): Cache of the `ETag` and
+            `Last-Modified` validators of GET responses, with their bodies.
+            GET requests for a cached response are sent as conditional
+            requests, and a `304 Not Modified` answer is served from it.
 
     Returns:
         dict or None: The JSON response data if available, otherwise None.
     """
     headers = headers or {"Content-Type": "application/json"}
-    response = requests.request(
+    key = cached = None
+    if validator_cache is not None and method == "GET":
+        key = validator_key(url, params)
+        cached = validator_cache.get(key)
+        if cached is not None:
+            headers = {**headers, **conditional_headers(cached)}
+
+    send = pool.request if pool is not None else requests.request
+    response = send(
         method,
         url,
         headers=headers,
         json=data,
         params=params,
     )
+    if cached is not None and response.status_code == 304:
+        return copy.deepcopy(cached.data)
     response.raise_for_status()
-    if response.content:
-        response.raise_for_status()
-        json_data = response.json()
-        return json_data
-    return None
+    json_data = response.json() if response.content else None
+    if key is not None:
+        validated = validated_response(response.headers, json_data)
+        if validated is not None:
+            # The caller owns json_data, so the cache keeps a copy of its own
+            validator_cache.set(key, validated._replace(data=copy.deepcopy(json_data)))
+        else:
+            validator_cache.pop(key)
+    return json_data
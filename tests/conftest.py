@@ -0,0 +1,159 @@
+"""Shared fixtures of the swarmbasecore test suite."""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Set, Tuple
+
+import pytest
+
+from swarmbasecore.utils import close_connection_pools
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class FakeApi:
+    """In-memory stand-in for the SwarmBase Flask app.
+
+    Serves `/api/<collection>`, `/api/<collection>/<id>` and
+    `/api/<collection>/<id>/<sub-resource>` on a local port, answers GETs
+    with an `ETag`, and records every request it receives.
+    """
+
+    def __init__(self) -> None:
+        self.resources: Dict[str, Dict[str, Dict[str, Any]]] = {
+            "agents": {},
+            "frameworks": {},
+            "swarms": {},
+            "tools": {},
+        }
+        self.requests: Counter = Counter()
+        self.connections: Set[Tuple[str, int]] = set()
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def add(self, collection: str, resource_id: str, **fields) -> Dict[str, Any]:
+        resource = {"id": resource_id, **fields}
+        self.resources[collection][resource_id] = resource
+        return resource
+
+    def count(self, method: str, path: str) -> int:
+        return self.requests[(method, path)]
+
+    def start(self) -> None:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def get(self, path: str) -> Tuple[int, Any]:
+        parts = path.split("/")[2:]
+        collection = self.resources.get(parts[0])
+        if collection is None:
+            return 404, {"error": "Not found"}
+        if len(parts) == 1:
+            return 200, list(collection.values())
+        resource = collection.get(parts[1])
+        if resource is None:
+            return 404, {"error": "Not found"}
+        if len(parts) == 3:
+            return 200, resource.get(parts[2], [])
+        return 200, resource
+
+    def write(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        parts = path.split("/")[2:]
+        collection = self.resources.get(parts[0])
+        if collection is None:
+            return 404, {"error": "Not found"}
+        if len(parts) == 1 and method == "POST":
+            resource_id = str(body.get("id") or len(collection) + 1)
+            return 201, self.add(parts[0], resource_id, **{**body, "id": resource_id})
+        resource = collection.get(parts[1]) if len(parts) > 1 else None
+        if resource is None:
+            return 404, {"error": "Not found"}
+        if len(parts) == 3 and method == "POST":
+            resource.setdefault(parts[2], []).append(body)
+            return 200, resource
+        if len(parts) == 2 and method == "PUT":
+            resource.update(body)
+            return 200, resource
+        if len(parts) == 2 and method == "DELETE":
+            del collection[parts[1]]
+            return 200, {}
+        return 405, {"error": "Method not allowed"}
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _record(self) -> str:
+                path = self.path.split("?", 1)[0]
+                with api.lock:
+                    api.requests[(self.command, path)] += 1
+                    api.connections.add(self.client_address)
+                return path
+
+            def _send(self, status: int, data: Any = None, headers=()) -> None:
+                body = b"" if data is None else json.dumps(data).encode()
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self) -> Optional[Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"null")
+
+            def do_GET(self):
+                path = self._record()
+                with api.lock:
+                    status, data = api.get(path)
+                    data = json.loads(json.dumps(data))
+                if status != 200:
+                    return self._send(status, data)
+                etag = '"%s"' % hashlib.sha1(json.dumps(data).encode()).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with api.lock:
+                        api.not_modified += 1
+                    return self._send(304, headers=[("ETag", etag)])
+                return self._send(200, data, headers=[("ETag", etag)])
+
+            def _do_write(self):
+                path = self._record()
+                body = self._body()
+                with api.lock:
+                    status, data = api.write(self.command, path, body)
+                self._send(status, data)
+
+            do_POST = do_PUT = do_DELETE = _do_write
+
+        return Handler
+
+
+@pytest.fixture
+def api():
+    """A running `FakeApi`, with the shared connection pools reset afterwards."""
+    server = FakeApi()
+    server.start()
+    try:
+        yield server
+    finally:
+        close_connection_pools()
+        server.stop()
+
@@ -0,0 +1,90 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from swarmbasecore.agency_swarm_framework.agency_pool import AgencyPool, PoolExhausted
+
+
+class FakeThread:
+    def __init__(self):
+        self.id = None
+        self._thread = self._run = self._stream = None
+
+
+class FakeAgency:
+    """Stands in for an agency_swarm Agency with a CEO and a developer."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.main_thread = FakeThread()
+        self.agents_and_threads = {
+            "main_thread": self.main_thread,
+            "CEO": {"Developer": FakeThread()},
+        }
+
+    def get_completion(self, message, **kwargs):
+        if self.main_thread.id is None:
+            self.main_thread.id = uuid.uuid4().hex
+        time.sleep(self.delay)
+        return self.main_thread.id
+
+
+def test_agencies_are_built_one_at_a_time():
+    building = []
+    overlaps = []
+
+    def factory():
+        building.append(None)
+        overlaps.append(len(building))
+        time.sleep(0.01)
+        building.pop()
+        return FakeAgency()
+
+    pool = AgencyPool(factory, size=4)
+
+    assert len(pool.agencies) == 4
+    assert max(overlaps) == 1
+
+
+def test_sessions_keep_their_conversation_across_instances():
+    pool = AgencyPool(FakeAgency, size=2)
+
+    first = pool.get_completion("Hello", session_id="alice")
+    with pool.checkout():
+        second = pool.get_completion("Again", session_id="alice")
+
+    assert second == first
+    assert pool.get_completion("Hello", session_id="bob") != first
+
+
+def test_requests_of_a_session_are_served_one_at_a_time():
+    pool = AgencyPool(lambda: FakeAgency(delay=0.05), size=2)
+    responses = []
+
+    def ask():
+        responses.append(pool.get_completion("Hello", session_id="alice"))
+
+    threads = [threading.Thread(target=ask) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(responses) == 2
+    assert responses[0] == responses[1]
+    assert pool._session_locks == {}
+
+
+def test_busy_session_times_out():
+    pool = AgencyPool(FakeAgency, size=2)
+
+    with pool.session("alice"):
+        with pytest.raises(PoolExhausted):
+            with pool.session("alice", timeout=0.01):
+                pass
+        with pool.session("bob", timeout=0.01):
+            pass
+
+    assert pool.idle == 2
@@ -0,0 +1,94 @@
+import asyncio
+import gc
+import threading
+import warnings
+
+from swarmbasecore.async_clients import (
+    AsyncAgentClient,
+    AsyncConnectionPool,
+    in_flight_gets,
+    make_async_request,
+)
+from swarmbasecore.utils import TTLCache
+from swarmbasecore.utils.utils import validator_key
+
+
+def test_pool_is_shared_by_consecutive_event_loops(api):
+    api.add("agents", "a1", name="Agent")
+    pool = AsyncConnectionPool()
+
+    async def get():
+        return await AsyncAgentClient(api.url, pool=pool).get("a1")
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert asyncio.run(get())["name"] == "Agent"
+        assert asyncio.run(get())["name"] == "Agent"
+        asyncio.run(pool.close())
+        gc.collect()
+
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_pool_is_shared_by_event_loops_of_several_threads(api):
+    api.add("agents", "a1", name="Agent")
+    pool = AsyncConnectionPool()
+    results = []
+
+    async def get_many():
+        client = AsyncAgentClient(api.url, pool=pool)
+        return await asyncio.gather(*(client.get("a1") for _ in range(20)))
+
+    def run():
+        results.extend(asyncio.run(get_many()))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    asyncio.run(pool.close())
+
+    assert len(results) == 80
+    assert all(result["name"] == "Agent" for result in results)
+
+
+def test_unchanged_resources_are_revalidated_instead_of_downloaded(api):
+    api.add("agents", "a1", name="Agent")
+    pool = AsyncConnectionPool()
+
+    async def get_twice():
+        client = AsyncAgentClient(api.url, pool=pool, validator_cache=TTLCache())
+        (await client.get("a1"))["name"] = "Changed by the caller"
+        return await client.get("a1")
+
+    assert asyncio.run(get_twice())["name"] == "Agent"
+    asyncio.run(pool.close())
+
+    assert api.not_modified == 1
+
+
+def test_gets_after_a_write_do_not_join_a_get_sent_before_it(api):
+    api.add("agents", "a1", name="Agent")
+    pool = AsyncConnectionPool()
+
+    async def main():
+        client = AsyncAgentClient(api.url, pool=pool, coalesce=True)
+        url = f"{client.client_url}/a1"
+        fetched, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_get():
+            response = await make_async_request("GET", url, pool=pool)
+            fetched.set()
+            await release.wait()
+            return response
+
+        before = asyncio.create_task(in_flight_gets.do(validator_key(url), slow_get))
+        await fetched.wait()
+        await client.update("a1", {"name": "Renamed"})
+        after = await asyncio.wait_for(client.get("a1"), 1)
+        release.set()
+        return (await before)["name"], after["name"]
+
+    assert asyncio.run(main()) == ("Agent", "Renamed")
+    asyncio.run(pool.close())
@@ -0,0 +1,98 @@
+import pytest
+
+from swarmbasecore.agency_chart import AgencyChart
+from swarmbasecore.builders import AgentBuilder, Swarm, SwarmBuilder
+from swarmbasecore.clients import AgentClient, SwarmClient
+
+
+def supervises(source, target):
+    return {
+        "relationship_type": "supervises",
+        "source_agent_id": source,
+        "target_agent_id": target,
+    }
+
+
+def tool_versions(code):
+    return [
+        {"version": "1.0", "code": "old", "created_at": "2024-01-01T00:00:00.000000"},
+        {"version": "1.1", "code": code, "created_at": "2024-02-01T00:00:00.000000"},
+    ]
+
+
+@pytest.fixture
+def swarm_api(api):
+    api.add("tools", "t1", name="Search", code_versions=tool_versions("search()"))
+    api.add("tools", "t2", name="Deploy", code_versions=tool_versions("deploy()"))
+    api.add(
+        "agents",
+        "a1",
+        name="CEO",
+        relationships=[supervises("a1", "a2"), supervises("a1", "a3")],
+        tools=["t1"],
+    )
+    api.add(
+        "agents",
+        "a2",
+        name="Developer",
+        relationships=[supervises("a1", "a2")],
+        tools=["t1", "t2"],
+    )
+    # Only reachable through the relationships of the listed agents
+    api.add("agents", "a3", name="Tester", relationships=[], tools=["t2"])
+    api.add("swarms", "s1", name="Team", agents=[{"id": "a1"}, {"id": "a2"}])
+    return api
+
+
+def build_swarm(api, monkeypatch, max_workers):
+    # The chart is a class attribute of Swarm, give each build its own
+    monkeypatch.setattr(Swarm, "agency_chart", AgencyChart())
+    api.requests.clear()
+    builder = SwarmBuilder(SwarmClient(api.url))
+    return builder.from_id("s1", max_workers=max_workers).product
+
+
+HYDRATED = (
+    "/api/agents/a1",
+    "/api/agents/a2",
+    "/api/agents/a3",
+    "/api/tools/t1",
+    "/api/tools/t2",
+)
+
+
+def assert_fetched_once(api, *paths):
+    for path in paths:
+        assert api.count("GET", path) == 1, path
+
+
+def test_parallel_swarm_hydration_matches_the_sequential_one(swarm_api, monkeypatch):
+    sequential = build_swarm(swarm_api, monkeypatch, None)
+    assert_fetched_once(swarm_api, *HYDRATED)
+    parallel = build_swarm(swarm_api, monkeypatch, 4)
+    assert_fetched_once(swarm_api, *HYDRATED)
+
+    for swarm in (sequential, parallel):
+        assert list(swarm.agents) == ["a1", "a2", "a3"]
+        assert list(swarm.tools) == ["t1", "t2"]
+        assert swarm.agents["a2"].tools[0] is swarm.agents["a1"].tools[0]
+        assert swarm.tools["t2"] is swarm.agents["a3"].tools[0]
+    assert parallel.agents == sequential.agents
+    assert parallel.tools == sequential.tools
+    assert parallel.tools["t1"].code == "search()"
+    assert parallel.agents["a1"].relationships == sequential.agents["a1"].relationships
+    assert dict(parallel.agency_chart.graph) == dict(sequential.agency_chart.graph)
+    assert parallel.agency_chart.manager_agent == sequential.agency_chart.manager_agent
+    assert parallel.agency_chart.manager_agent == "a1"
+
+
+def test_parallel_agent_hydration_matches_the_sequential_one(swarm_api):
+    client = AgentClient(swarm_api.url)
+    sequential = AgentBuilder(client).from_id("a2").product
+    swarm_api.requests.clear()
+
+    parallel = AgentBuilder(client).from_id("a2", max_workers=4).product
+
+    assert parallel == sequential
+    assert [tool.name for tool in parallel.tools] == ["Search", "Deploy"]
+    assert_fetched_once(swarm_api, "/api/agents/a2", "/api/tools/t1", "/api/tools/t2")
@@ -0,0 +1,178 @@
+import threading
+import time
+
+from swarmbasecore.clients import AgentClient, ToolClient, in_flight_gets
+from swarmbasecore.utils import (
+    ConnectionPool,
+    TTLCache,
+    close_connection_pools,
+    get_connection_pool,
+    make_request,
+)
+from swarmbasecore.utils.utils import validator_key
+
+
+def test_clients_of_a_base_url_share_one_pool(api):
+    agent_client = AgentClient(api.url)
+    tool_client = ToolClient(api.url)
+
+    assert agent_client.pool is tool_client.pool
+    assert agent_client.pool is get_connection_pool(api.url)
+    assert AgentClient(f"{api.url}/").pool is not agent_client.pool
+
+
+def test_requests_reuse_a_keep_alive_connection(api):
+    api.add("agents", "a1", name="Agent")
+    api.add("tools", "t1", name="Tool")
+    agent_client = AgentClient(api.url)
+    tool_client = ToolClient(api.url)
+
+    for _ in range(5):
+        assert agent_client.get("a1")["name"] == "Agent"
+        assert tool_client.get("t1")["name"] == "Tool"
+
+    assert api.count("GET", "/api/agents/a1") == 5
+    assert len(api.connections) == 1
+
+
+def test_close_connection_pools_forgets_the_shared_pools(api):
+    pool = get_connection_pool(api.url)
+    close_connection_pools()
+
+    assert get_connection_pool(api.url) is not pool
+
+
+def test_idle_connections_are_evicted(api):
+    api.add("agents", "a1")
+    agent_client = AgentClient(api.url, pool=ConnectionPool(idle_timeout=0.01))
+
+    agent_client.get("a1")
+    time.sleep(0.05)
+    agent_client.get("a1")
+
+    assert len(api.connections) == 2
+
+
+def test_gets_are_served_from_the_cache(api):
+    api.add("agents", "a1", name="Agent")
+    agent_client = AgentClient(api.url, cache=TTLCache())
+
+    agent_client.get("a1")["name"] = "Changed by the caller"
+
+    assert agent_client.get("a1")["name"] == "Agent"
+    assert api.count("GET", "/api/agents/a1") == 1
+    assert agent_client.cache_info().hits == 1
+
+
+def test_writes_invalidate_the_resource_and_the_listing(api):
+    api.add("agents", "a1", name="Agent")
+    api.add("agents", "a2", name="Other")
+    agent_client = AgentClient(api.url, cache=TTLCache())
+    agent_client.get("a1")
+    agent_client.get("a2")
+    agent_client.list()
+
+    agent_client.update("a1", {"name": "Renamed"})
+
+    assert agent_client.get("a1")["name"] == "Renamed"
+    assert [agent["name"] for agent in agent_client.list()] == ["Renamed", "Other"]
+    agent_client.get("a2")
+    assert api.count("GET", "/api/agents/a1") == 2
+    assert api.count("GET", "/api/agents") == 2
+    assert api.count("GET", "/api/agents/a2") == 1
+
+
+def test_a_write_of_another_client_of_the_cache_invalidates_gets_in_flight(
+    api, monkeypatch
+):
+    api.add("agents", "a1", name="Agent")
+    cache = TTLCache()
+    reader = AgentClient(api.url, cache=cache)
+    writer = reader.derive(AgentClient)
+    fetch = reader._fetch
+
+    def fetch_during_a_write(url, params=None):
+        response = fetch(url, params)
+        writer.update("a1", {"name": "Renamed"})
+        return response
+
+    monkeypatch.setattr(reader, "_fetch", fetch_during_a_write)
+    assert reader.get("a1")["name"] == "Agent"
+    monkeypatch.undo()
+
+    assert reader.get("a1")["name"] == "Renamed"
+
+
+def test_unchanged_resources_are_revalidated_instead_of_downloaded(api):
+    api.add("tools", "t1", name="Tool")
+    tool_client = ToolClient(api.url, validator_cache=TTLCache())
+
+    tool_client.get("t1")["name"] = "Changed by the caller"
+    assert tool_client.get("t1")["name"] == "Tool"
+    assert api.not_modified == 1
+
+    api.add("tools", "t1", name="Renamed")
+    assert tool_client.get("t1")["name"] == "Renamed"
+    assert api.not_modified == 1
+    assert api.count("GET", "/api/tools/t1") == 3
+
+
+def test_gets_after_a_write_do_not_join_a_get_sent_before_it(api):
+    api.add("agents", "a1", name="Agent")
+    agent_client = AgentClient(api.url, cache=TTLCache(), coalesce=True)
+    url = f"{agent_client.client_url}/a1"
+    fetched, release = threading.Event(), threading.Event()
+
+    def slow_get():
+        response = make_request("GET", url)
+        fetched.set()
+        release.wait(1)
+        return response
+
+    before = threading.Thread(
+        target=in_flight_gets.do,
+        args=(validator_key(url), slow_get),
+    )
+    before.start()
+    fetched.wait()
+    agent_client.update("a1", {"name": "Renamed"})
+
+    assert agent_client.get("a1")["name"] == "Renamed"
+    release.set()
+    before.join()
+    assert agent_client.get("a1")["name"] == "Renamed"
+
+
+def test_iter_list_follows_the_pages(api, monkeypatch):
+    pages = {
+        None: {"items": [1, 2], "next_cursor": "c2"},
+        "c2": {"items": [3], "has_next": True, "next_num": 3},
+        3: {"items": [4], "has_next": False},
+    }
+    agent_client = AgentClient(api.url)
+    requested = []
+
+    def request(method, url, data=None, params=None):
+        requested.append(params)
+        return pages[params.get("cursor", params.get("page"))]
+
+    monkeypatch.setattr(agent_client, "_request", request)
+
+    for prefetch in (False, True):
+        requested.clear()
+        items = agent_client.iter_list(page_size=2, prefetch=prefetch)
+        assert list(items) == [1, 2, 3, 4]
+        assert requested == [
+            {"per_page": 2},
+            {"per_page": 2, "cursor": "c2"},
+            {"per_page": 2, "page": 3},
+        ]
+
+
+def test_iter_list_of_an_unpaginated_listing(api):
+    api.add("agents", "a1")
+    api.add("agents", "a2")
+
+    ids = [agent["id"] for agent in AgentClient(api.url).iter_list(page_size=1)]
+
+    assert ids == ["a1", "a2"]
@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import pytest
+
+from swarmbasecore import create_venv
+from swarmbasecore.create_venv import (
+    MANIFEST_FILE_NAME,
+    write_files,
+    write_files_atomically,
+)
+
+EXPORT = {
+    Path("__main__.py"): "main",
+    Path("agents/A/__init__.py"): "a",
+    Path("agents/B/__init__.py"): "b",
+}
+
+
+def read_tree(root: Path):
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.name != MANIFEST_FILE_NAME
+    }
+
+
+def test_incremental_export_writes_only_changed_files(tmp_path):
+    root = tmp_path / "swarm"
+    write_files(root, EXPORT, incremental=True)
+    (root / "agents/A/custom.py").write_text("mine")
+
+    summary = write_files(
+        root,
+        {Path("__main__.py"): "main", Path("agents/A/__init__.py"): "a2"},
+        incremental=True,
+    )
+
+    assert summary.written == [Path("agents/A/__init__.py")]
+    assert summary.skipped == [Path("__main__.py")]
+    assert summary.removed == [Path("agents/B/__init__.py")]
+    assert read_tree(root) == {
+        "__main__.py": "main",
+        "agents/A/__init__.py": "a2",
+        "agents/A/custom.py": "mine",
+    }
+    assert not (root / "agents/B").exists()
+
+
+def test_incremental_export_rewrites_files_missing_on_disk(tmp_path):
+    root = tmp_path / "swarm"
+    write_files(root, EXPORT, incremental=True)
+    (root / "__main__.py").unlink()
+
+    summary = write_files(root, EXPORT, incremental=True)
+
+    assert summary.written == [Path("__main__.py")]
+    assert read_tree(root)["__main__.py"] == "main"
+
+
+def test_atomic_export_switches_a_link_to_the_new_export(tmp_path):
+    root = tmp_path / "swarm"
+    write_files_atomically(root, EXPORT)
+    first = root.resolve()
+
+    summary = write_files_atomically(root, {Path("__main__.py"): "main2"})
+
+    assert root.is_symlink()
+    assert root.resolve() != first
+    assert not first.exists()
+    assert summary.removed == [
+        Path("agents/A/__init__.py"),
+        Path("agents/B/__init__.py"),
+    ]
+    assert read_tree(root) == {"__main__.py": "main2"}
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        root.resolve().name,
+        "swarm",
+    ]
+
+
+def test_atomic_export_carries_over_files_it_did_not_generate(tmp_path):
+    root = tmp_path / "swarm"
+    write_files_atomically(root, EXPORT)
+    (root / ".venv/bin").mkdir(parents=True)
+    (root / ".venv/bin/python").write_text("venv")
+    (root / "agents/A/custom.py").write_text("mine")
+    (root / "agents/B/notes.txt").write_text("notes")
+
+    write_files_atomically(root, {Path("agents/A/__init__.py"): "a2"})
+
+    assert read_tree(root) == {
+        ".venv/bin/python": "venv",
+        "agents/A/__init__.py": "a2",
+        "agents/A/custom.py": "mine",
+        "agents/B/notes.txt": "notes",
+    }
+
+
+def test_atomic_export_leaves_the_live_export_intact_until_the_swap(
+    tmp_path, monkeypatch
+):
+    root = tmp_path / "swarm"
+    write_files_atomically(root, EXPORT)
+    (root / ".venv/bin").mkdir(parents=True)
+    (root / ".venv/bin/python").write_text("venv")
+    (root / "agents/A/custom.py").write_text("mine")
+    before = read_tree(root)
+    swap = create_venv._swap_directory
+    seen = []
+
+    def spy(new, target):
+        seen.append(read_tree(target))
+        return swap(new, target)
+
+    monkeypatch.setattr(create_venv, "_swap_directory", spy)
+    write_files_atomically(root, {Path("agents/A/__init__.py"): "a2"})
+
+    assert seen == [before]
+    assert read_tree(root) == {
+        ".venv/bin/python": "venv",
+        "agents/A/__init__.py": "a2",
+        "agents/A/custom.py": "mine",
+    }
+
+
+def test_atomic_export_converts_a_plain_directory(tmp_path):
+    root = tmp_path / "swarm"
+    write_files(root, EXPORT)
+    (root / "agents/A/custom.py").write_text("mine")
+
+    write_files_atomically(root, EXPORT)
+
+    assert root.is_symlink()
+    assert read_tree(root) == {
+        **{path.as_posix(): content for path, content in EXPORT.items()},
+        "agents/A/custom.py": "mine",
+    }
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_failed_atomic_export_leaves_the_previous_one_in_place(tmp_path, monkeypatch):
+    root = tmp_path / "swarm"
+    write_files_atomically(root, EXPORT)
+    (root / "agents/A/custom.py").write_text("mine")
+    before = read_tree(root)
+    current = root.resolve()
+
+    def fail(new, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(create_venv, "_swap_directory", fail)
+    with pytest.raises(OSError):
+        write_files_atomically(root, {Path("__main__.py"): "main2"})
+
+    assert root.resolve() == current
+    assert read_tree(root) == before
+    assert sorted(path.name for path in tmp_path.iterdir()) == [current.name, "swarm"]
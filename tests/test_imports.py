@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("agency_swarm", "openai", "langchain")
+
+
+def imported_modules(statement):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return output.splitlines()
+
+
+def test_light_submodules_do_not_import_agency_swarm():
+    modules = imported_modules(
+        "import swarmbasecore.clients, swarmbasecore.agency_chart",
+    )
+
+    assert "swarmbasecore.clients" in modules
+    assert not [
+        module for module in modules if module.split(".")[0].startswith(HEAVY_MODULES)
+    ]
+
+
+def test_public_names_are_loaded_on_access():
+    modules = imported_modules(
+        "import swarmbasecore\nassert swarmbasecore.swarmy_agent.LoggedAgent",
+    )
+
+    assert "agency_swarm" in modules
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from swarmbasecore.utils import AsyncSingleFlight, SingleFlight
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def fetch():
+        release.wait(5)
+        return {"value": 1}
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", fetch)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: flight.shared == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert flight.calls == 1
+    assert results == [{"value": 1}] * 4
+    assert len({id(result) for result in results}) == 4
+
+
+def test_forgotten_calls_are_not_joined():
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def stale():
+        release.wait(5)
+        return "stale"
+
+    thread = threading.Thread(target=lambda: results.append(flight.do("key", stale)))
+    thread.start()
+    wait_until(lambda: flight.calls == 1)
+    flight.forget(lambda key: key == "key")
+
+    assert flight.do("key", lambda: "fresh") == "fresh"
+    release.set()
+    thread.join()
+    assert results == ["stale"]
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    async def main():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return {"value": 1}
+
+        leader = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == {"value": 1}
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert flight.calls == 1
+
+    asyncio.run(main())
+
+
+def test_a_call_is_cancelled_once_all_its_callers_are():
+    async def main():
+        flight = AsyncSingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+
+        async def fresh():
+            return "fresh"
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert await flight.do("key", fresh) == "fresh"
+
+    asyncio.run(main())
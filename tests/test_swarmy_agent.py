@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+from agency_swarm.agents.agent import Agent
+
+from swarmbasecore.agency_swarm_framework.swarmy_agent import LoggedAgent
+
+
+@pytest.fixture
+def init_oai_calls(tmp_path, monkeypatch):
+    # Agent log files are opened in the working directory.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    running = []
+    calls = []
+
+    def init_oai(agent):
+        running.append(agent.name)
+        calls.append(len(running))
+        time.sleep(0.01)
+        running.remove(agent.name)
+        agent.id = f"asst_{agent.name}"
+        return agent
+
+    monkeypatch.setattr(Agent, "init_oai", init_oai)
+    return calls
+
+
+def test_deferred_agents_are_materialized_one_at_a_time(init_oai_calls):
+    agents = [LoggedAgent(name=f"Agent{i}", description="Test") for i in range(4)]
+    for agent in agents:
+        agent.defer_init_oai()
+        agent.init_oai()
+
+    threads = [threading.Thread(target=lambda a=agent: a.id) for agent in agents]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [agent.id for agent in agents] == [f"asst_Agent{i}" for i in range(4)]
+    assert init_oai_calls == [1, 1, 1, 1]
+
+
+def test_on_materialize_runs_after_the_deferred_init_oai(init_oai_calls):
+    agent = LoggedAgent(name="Lazy", description="Test")
+    materialized = []
+    agent.defer_init_oai(lambda a: materialized.append(a.id))
+    agent.init_oai()
+
+    assert materialized == []
+    assert agent.id == "asst_Lazy"
+    assert agent.id == "asst_Lazy"
+    assert materialized == ["asst_Lazy"]
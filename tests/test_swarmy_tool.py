@@ -0,0 +1,48 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from swarmbasecore.agency_swarm_framework.swarmy_tool import LoggedBaseTool
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    # Tool log files are opened in the working directory when the class is made.
+    monkeypatch.chdir(tmp_path)
+    runs: Counter = Counter()
+
+    class Lookup(LoggedBaseTool):
+        cache_results = True
+        query: str
+
+        def run(self):
+            runs["lookup"] += 1
+            return {"query": self.query, "rows": [1, 2]}
+
+    class Stream(LoggedBaseTool):
+        cache_results = True
+
+        def run(self):
+            runs["stream"] += 1
+            return iter(["a", "b"])
+
+    return SimpleNamespace(Lookup=Lookup, Stream=Stream, runs=runs)
+
+
+def test_cache_hits_return_a_copy_of_the_result(tools):
+    first = tools.Lookup(query="q").run()
+    first["rows"].append(3)
+
+    second = tools.Lookup(query="q").run()
+    second["rows"].append(4)
+
+    assert tools.Lookup(query="q").run() == {"query": "q", "rows": [1, 2]}
+    assert tools.runs["lookup"] == 1
+    assert tools.Lookup.cache_info()["hits"] == 2
+
+
+def test_iterator_results_are_not_cached(tools):
+    assert list(tools.Stream().run()) == ["a", "b"]
+    assert list(tools.Stream().run()) == ["a", "b"]
+    assert tools.runs["stream"] == 2
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from swarmbasecore.agency_swarm_framework.swarmy_tool import LoggedBaseTool
+from swarmbasecore.agency_swarm_framework.tool_executor import (
+    ConcurrentToolCalls,
+    ToolExecutor,
+)
+
+
+class Search(LoggedBaseTool):
+    def run(self):
+        return "found"
+
+
+class Answer(LoggedBaseTool):
+    class ToolConfig:
+        output_as_result = True
+
+    def run(self):
+        return "answer"
+
+
+class Upload(LoggedBaseTool):
+    class ToolConfig:
+        async_mode = "threading"
+
+    def run(self):
+        return "uploaded"
+
+
+def tool_call(call_id, name):
+    return SimpleNamespace(
+        id=call_id,
+        type="function",
+        function=SimpleNamespace(name=name, arguments="{}"),
+    )
+
+
+class RecordingExecutor(ToolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = []
+
+    def submit(self, tool_class, fn, *args):
+        self.submitted.append(args[1].id)
+        return super().submit(tool_class, lambda: None)
+
+
+def submitted(*calls):
+    thread = ConcurrentToolCalls()
+    thread.tool_executor = executor = RecordingExecutor()
+    thread._run = SimpleNamespace(
+        required_action=SimpleNamespace(
+            submit_tool_outputs=SimpleNamespace(tool_calls=list(calls)),
+        ),
+    )
+    agent = SimpleNamespace(functions=[Search, Answer, Upload])
+
+    thread._submit_tool_calls(agent, None)
+    executor.shutdown()
+    return executor.submitted
+
+
+def test_independent_calls_are_all_submitted():
+    assert submitted(tool_call("1", "Search"), tool_call("2", "Search")) == ["1", "2"]
+
+
+def test_calls_after_an_output_as_result_tool_are_not_submitted():
+    calls = [
+        tool_call("1", "Search"),
+        tool_call("2", "Answer"),
+        tool_call("3", "Search"),
+    ]
+
+    assert submitted(*calls) == ["1", "2"]
+
+
+def test_async_mode_calls_are_ordered_last():
+    calls = [
+        tool_call("1", "Upload"),
+        tool_call("2", "Search"),
+        tool_call("3", "Answer"),
+        tool_call("4", "Search"),
+    ]
+
+    assert submitted(*calls) == ["2", "3"]
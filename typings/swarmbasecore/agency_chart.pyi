@@ -1,13 +1,16 @@
 from .utils import AgentRelationship as AgentRelationship, RelationshipType as RelationshipType
 from _typeshed import Incomplete
-from typing import Annotated
+from typing import Annotated, Iterable
 
 class AgencyChart:
     graph: Incomplete
     def __init__(self) -> None: ...
     def add_relationship(self, relationship: AgentRelationship): ...
     def remove_agent(self, agent: Annotated[str, 'agent_id']): ...
+    def in_degree(self, agent: Annotated[str, 'agent_id']) -> int: ...
     def is_connected(self, source: Annotated[str, 'agent_id'], target: Annotated[str, 'agent_id']): ...
     def find_path(self, source: Annotated[str, 'agent_id'], target: Annotated[str, 'agent_id'], path=[]): ...
+    def shortest_path(self, source: Annotated[str, 'agent_id'], target: Annotated[str, 'agent_id']) -> list[str] | None: ...
+    def paths_from(self, source: Annotated[str, 'agent_id'], targets: Iterable[Annotated[str, 'agent_id']]) -> dict[str, list[str] | None]: ...
     @property
     def manager_agent(self) -> Annotated[str, 'agent_id'] | None: ...
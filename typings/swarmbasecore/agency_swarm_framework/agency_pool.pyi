@@ -0,0 +1,30 @@
+from agency_swarm import Agency
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+ThreadIds = dict[str, Any]
+
+def get_thread_ids(agency: Agency) -> ThreadIds: ...
+def load_thread_ids(agency: Agency, thread_ids: ThreadIds) -> None: ...
+
+class PoolExhausted(Exception): ...
+
+class AgencyPool:
+    factory: Callable[[], Agency]
+    size: int
+    max_waiting: int | None
+    max_sessions: int
+    agencies: list[Agency]
+    def __init__(self, factory: Callable[[], Agency], size: int = 4, max_waiting: int | None = None, max_sessions: int = 10000) -> None: ...
+    def acquire(self, timeout: float | None = None) -> Agency: ...
+    def release(self, agency: Agency) -> None: ...
+    @contextmanager
+    def checkout(self, timeout: float | None = None) -> Iterator[Agency]: ...
+    @contextmanager
+    def session(self, session_id: str, timeout: float | None = None) -> Iterator[Agency]: ...
+    def get_completion(self, message: str, session_id: str | None = None, timeout: float | None = None, **kwargs) -> str: ...
+    @property
+    def idle(self) -> int: ...
+    @property
+    def waiting(self) -> int: ...
+    def serve_agency(self, origins: list[str], host: str = "0.0.0.0", port: int = 8000, timeout: float | None = 30.0) -> None: ...
@@ -0,0 +1,3 @@
+def configure_process_pool(max_workers: int | None = None) -> None: ...
+def shutdown_process_pool() -> None: ...
+def run_in_process(func): ...
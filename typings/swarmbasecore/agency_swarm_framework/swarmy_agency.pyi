@@ -1,5 +1,7 @@
 import gradio as gr
 from ..logging_utils import setup_logger as setup_logger
+from .process_pool import configure_process_pool as configure_process_pool
+from .tool_executor import ToolExecutor as ToolExecutor, enable_concurrent_tool_calls as enable_concurrent_tool_calls
 from _typeshed import Incomplete
 from agency_swarm import Agency
 from fastapi import Request as Request
@@ -9,7 +11,10 @@ from openai.types.beta.threads.runs.tool_call import ToolCall as ToolCall
 
 class SwarmyAgency(Agency):
     logger: Incomplete
-    def __init__(self, *args, **kwargs) -> None: ...
+    tool_executor: ToolExecutor | None
+    lazy_agents: bool
+    startup_seconds: float
+    def __init__(self, *args, tool_workers: int | None = None, tool_processes: int | None = None, lazy_agents: bool = False, **kwargs) -> None: ...
     def log_message(self, message_log) -> None: ...
     message_output: Incomplete
     def demo_gradio(self, height: int = 450, dark_mode: bool = True) -> gr.Blocks: ...
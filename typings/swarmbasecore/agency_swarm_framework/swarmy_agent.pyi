@@ -1,11 +1,22 @@
 from ..logging_utils import setup_logger as setup_logger
 from _typeshed import Incomplete
 from agency_swarm.agents.agent import Agent
+from typing import Callable
 
-def log_method(logger): ...
+def logged_method(func): ...
+def instrument_class(cls): ...
 
 class LoggedAgent(Agent):
     name: Incomplete
     logger: Incomplete
     def __init__(self, *args, **kwargs) -> None: ...
-    def __getattribute__(self, name): ...
+    def __init_subclass__(cls, **kwargs) -> None: ...
+    @property
+    def id(self): ...
+    @id.setter
+    def id(self, value) -> None: ...
+    @property
+    def materialized(self) -> bool: ...
+    def defer_init_oai(self, on_materialize: Callable[[LoggedAgent], None] | None = None) -> None: ...
+    def init_oai(self): ...
+    def materialize(self): ...
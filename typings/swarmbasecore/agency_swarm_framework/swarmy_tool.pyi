@@ -1,9 +1,62 @@
 from ..logging_utils import setup_logger as setup_logger
 from abc import ABC
+from pathlib import Path
 from agency_swarm.tools.BaseTool import BaseTool
+from ..utils import TTLCache as TTLCache
+from .process_pool import run_in_process as run_in_process
+from typing import Any, ClassVar
+
+def truncate(value: Any, limit: int | None) -> str: ...
+
+class LazyFields:
+    fields: dict[str, Any]
+    limit: int | None
+    def __init__(self, fields: dict[str, Any], limit: int | None) -> None: ...
+
+class LazyValue:
+    value: Any
+    limit: int | None
+    def __init__(self, value: Any, limit: int | None) -> None: ...
 
 def log_execution(logger, func): ...
 
+class ToolTimeout:
+    tool: str
+    timeout: float
+    error: str
+    def __init__(self, tool: str, timeout: float, error: str = "timeout") -> None: ...
+    @property
+    def message(self) -> str: ...
+
+def cancellation_requested() -> bool: ...
+def run_with_timeout(func): ...
+
+class ToolResultCache:
+    memory: TTLCache
+    directory: Path | None
+    ttl: float | None
+    disk_hits: int
+    def __init__(self, maxsize: int | None = 128, ttl: float | None = None, directory: str | None = None) -> None: ...
+    def lookup(self, key: str) -> tuple[bool, Any]: ...
+    def store(self, key: str, value: Any) -> None: ...
+    def info(self) -> dict[str, Any]: ...
+
+def memoize_run(func): ...
+
 class LoggedBaseTool(BaseTool, ABC):
+    log_max_field_length: ClassVar[int | None]
+    log_max_result_length: ClassVar[int | None]
+    cache_results: ClassVar[bool]
+    cache_maxsize: ClassVar[int | None]
+    cache_ttl: ClassVar[float | None]
+    cache_dir: ClassVar[str | None]
+    run_timeout: ClassVar[float | None]
+    max_concurrency: ClassVar[int | None]
+    run_in_process: ClassVar[bool]
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None: ...
+    @classmethod
+    def result_cache(cls) -> ToolResultCache: ...
+    @classmethod
+    def cache_info(cls) -> dict[str, Any]: ...
+    def cache_key(self) -> str: ...
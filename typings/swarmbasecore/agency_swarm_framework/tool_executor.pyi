@@ -0,0 +1,16 @@
+from .swarmy_tool import LoggedBaseTool as LoggedBaseTool
+from agency_swarm.threads import Thread
+from concurrent.futures import Future
+from typing import Any, Callable
+
+class ToolExecutor:
+    max_workers: int
+    def __init__(self, max_workers: int = 8) -> None: ...
+    def submit(self, tool_class: type, fn: Callable[..., Any], *args: Any) -> Future: ...
+    def shutdown(self, wait: bool = True) -> None: ...
+
+class ConcurrentToolCalls:
+    tool_executor: ToolExecutor | None
+    def execute_tool(self, tool_call, recipient_agent=None, event_handler=None, tool_outputs_and_names=None): ...
+
+def enable_concurrent_tool_calls(thread: Thread, executor: ToolExecutor) -> None: ...
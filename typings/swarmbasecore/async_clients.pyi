@@ -0,0 +1,70 @@
+from .clients import BulkResult as BulkResult, allowed_methods as allowed_methods, bulk_results as bulk_results, invalidated_by as invalidated_by, keyed_items as keyed_items, page_params as page_params, split_page as split_page
+from .utils import AsyncSingleFlight as AsyncSingleFlight, CacheInfo as CacheInfo, TTLCache as TTLCache
+from _typeshed import Incomplete
+from abc import ABC
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence, TypeVar
+
+AsyncClientT = TypeVar('AsyncClientT', bound='AsyncBaseClient')
+in_flight_gets: AsyncSingleFlight
+
+class AsyncConnectionPool:
+    limit: Incomplete
+    limit_per_host: Incomplete
+    keepalive_timeout: Incomplete
+    max_concurrency: Incomplete
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 60.0, max_concurrency: int = 100) -> None: ...
+    async def send(self, method, url, headers: Incomplete | None = None, data: Incomplete | None = None, params: Incomplete | None = None) -> tuple[int, Mapping[str, str], bytes]: ...
+    async def request(self, method, url, headers: Incomplete | None = None, data: Incomplete | None = None, params: Incomplete | None = None): ...
+    async def close(self) -> None: ...
+
+def get_async_connection_pool(base_url: str, **pool_kwargs) -> AsyncConnectionPool: ...
+async def close_async_connection_pools() -> None: ...
+async def make_async_request(method, url, headers: Incomplete | None = None, data: Incomplete | None = None, params: Incomplete | None = None, pool: Incomplete | None = None, validator_cache: TTLCache | None = None): ...
+async def run_concurrently(calls: Sequence[Callable[[], Awaitable[Any]]], max_concurrency: int = 8) -> list[BulkResult]: ...
+
+class AsyncBaseClient(ABC):
+    base_url: Incomplete
+    client_url: Incomplete
+    pool: Incomplete
+    cache: TTLCache | None
+    validator_cache: TTLCache | None
+    coalesce: bool
+    bulk_url: Incomplete
+    def __init__(self, base_url: str, resource: str, pool: AsyncConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
+    def derive(self, client_class: Callable[..., AsyncClientT]) -> AsyncClientT: ...
+    def cache_info(self) -> CacheInfo | None: ...
+    async def create(self, data: dict[str, Any]): ...
+    async def list(self): ...
+    def iter_list(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Any]: ...
+    async def get(self, resource_id: str): ...
+    async def update(self, resource_id: str, data: dict[str, Any]): ...
+    async def delete(self, resource_id: str): ...
+    async def create_many(self, items: Iterable[dict[str, Any]], max_concurrency: int = 8) -> list[BulkResult]: ...
+    async def get_many(self, resource_ids: Iterable[str], max_concurrency: int = 8) -> list[BulkResult]: ...
+    async def update_many(self, updates: dict[str, dict[str, Any]], max_concurrency: int = 8) -> list[BulkResult]: ...
+    async def delete_many(self, resource_ids: Iterable[str], max_concurrency: int = 8) -> list[BulkResult]: ...
+
+class AsyncAgentClient(AsyncBaseClient):
+    def __init__(self, base_url: str, pool: AsyncConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
+    async def assign_tool_to_agent(self, agent_id: str, tool_data: dict[str, Any]): ...
+    async def remove_tool_from_agent(self, agent_id: str, tool_data: dict[str, Any]): ...
+    async def get_tools(self, agent_id: str): ...
+    async def add_relationship(self, agent_id: str, data: dict[str, Any]): ...
+    async def get_relationships(self, agent_id: str): ...
+    async def remove_relationship(self, agent_id: str, related_agent_id: str): ...
+    async def assign_tools(self, assignments: Iterable[tuple[str, dict[str, Any]]], max_concurrency: int = 8) -> list[BulkResult]: ...
+    async def add_relationships(self, relationships: Iterable[tuple[str, dict[str, Any]]], max_concurrency: int = 8) -> list[BulkResult]: ...
+
+class AsyncFrameworkClient(AsyncBaseClient):
+    def __init__(self, base_url: str, pool: AsyncConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
+    async def add_swarm_to_framework(self, framework_id: str, swarm_data: dict[str, Any]): ...
+    async def remove_swarm_from_framework(self, framework_id: str, swarm_data: dict[str, Any]): ...
+    async def add_tool_to_framework(self, framework_id: str, tool_data): ...
+
+class AsyncSwarmClient(AsyncBaseClient):
+    def __init__(self, base_url: str, pool: AsyncConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
+    async def add_agent_to_swarm(self, swarm_id: str, agent_data: dict[str, Any]): ...
+    async def remove_agent_from_swarm(self, swarm_id: str, agent_data: dict[str, Any]): ...
+
+class AsyncToolClient(AsyncBaseClient):
+    def __init__(self, base_url: str, pool: AsyncConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
@@ -18,6 +18,11 @@ class Product:
     def __post_init__(self) -> None: ...
 T = TypeVar('T', bound='Product')
 
+class IdentityMap:
+    agents: dict[str, Agent]
+    tools: dict[str, Tool]
+    def __init__(self) -> None: ...
+
 class BaseBuilder(Generic[T]):
     client: BaseClient
     def __post_init__(self) -> None: ...
@@ -43,7 +48,8 @@ class ToolBuilder(BaseBuilder[Tool]):
     def set_description(self, description) -> None: ...
     def set_version(self, version) -> None: ...
     def set_code(self, code) -> None: ...
-    def from_id(self, id: str): ...
+    def from_id(self, id: str, identity_map: IdentityMap | None = None): ...
+    def from_data(self, id: str, data: dict[str, Any] | None, identity_map: IdentityMap | None = None): ...
 
 class Agent(Product):
     description: str | None
@@ -59,7 +65,8 @@ class AgentBuilder(BaseBuilder[Agent]):
     def set_instructions(self, instructions: str): ...
     def add_relationship(self, relationship: AgentRelationship): ...
     def add_tool(self, tool: Tool): ...
-    def from_id(self, id: str): ...
+    def from_id(self, id: str, identity_map: IdentityMap | None = None, max_workers: int | None = None): ...
+    def from_data(self, id: str, data: dict[str, Any] | None, identity_map: IdentityMap | None = None): ...
 
 class Framework(Product):
     def __post_init__(self) -> None: ...
@@ -81,4 +88,4 @@ class SwarmBuilder(BaseBuilder[Swarm]):
     def add_agent(self, agent: Agent): ...
     def add_agents_relationship(self, relationship: AgentRelationship): ...
     def add_tool(self, tool: Tool): ...
-    def from_id(self, id: str): ...
+    def from_id(self, id: str, identity_map: IdentityMap | None = None, max_workers: int | None = None): ...
@@ -1,35 +1,66 @@
-from .utils import make_request as make_request
+from .utils import CacheInfo as CacheInfo, ConnectionPool as ConnectionPool, SingleFlight as SingleFlight, TTLCache as TTLCache, get_connection_pool as get_connection_pool, make_request as make_request
 from _typeshed import Incomplete
 from abc import ABC
-from typing import Any
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, NamedTuple, Sequence, TypeVar
+
+ClientT = TypeVar('ClientT', bound='BaseClient')
+in_flight_gets: SingleFlight
+
+def invalidated_by(client_url: str, url: str) -> Callable[[Hashable], bool]: ...
+class BulkResult(NamedTuple):
+    result: Any = ...
+    error: BaseException | None = ...
+    @property
+    def ok(self) -> bool: ...
+
+def bulk_results(response: Any, count: int) -> list[BulkResult]: ...
+def keyed_items(pairs: Iterable[tuple[str, Any]]) -> list[dict[str, Any]]: ...
+def allowed_methods(headers: Mapping[str, str]) -> frozenset[str]: ...
+def page_params(page_size: int) -> dict[str, Any]: ...
+def split_page(params: dict[str, Any], page: Any) -> tuple[list[Any], dict[str, Any] | None]: ...
+def run_concurrently(calls: Sequence[Callable[[], Any]], max_workers: int = 8) -> list[BulkResult]: ...
 
 class BaseClient(ABC):
     base_url: Incomplete
     client_url: Incomplete
-    def __init__(self, base_url: str, resource: str) -> None: ...
+    pool: Incomplete
+    cache: TTLCache | None
+    validator_cache: TTLCache | None
+    coalesce: bool
+    bulk_url: Incomplete
+    def __init__(self, base_url: str, resource: str, pool: ConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
+    def derive(self, client_class: Callable[..., ClientT]) -> ClientT: ...
+    def cache_info(self) -> CacheInfo | None: ...
     def create(self, data: dict[str, Any]): ...
     def list(self): ...
+    def iter_list(self, page_size: int = 100, prefetch: bool = True) -> Iterator[Any]: ...
     def get(self, resource_id: str): ...
     def update(self, resource_id: str, data: dict[str, Any]): ...
     def delete(self, resource_id: str): ...
+    def create_many(self, items: Iterable[dict[str, Any]], max_workers: int = 8) -> list[BulkResult]: ...
+    def get_many(self, resource_ids: Iterable[str], max_workers: int = 8) -> list[BulkResult]: ...
+    def update_many(self, updates: dict[str, dict[str, Any]], max_workers: int = 8) -> list[BulkResult]: ...
+    def delete_many(self, resource_ids: Iterable[str], max_workers: int = 8) -> list[BulkResult]: ...
 
 class AgentClient(BaseClient):
-    def __init__(self, base_url: str) -> None: ...
+    def __init__(self, base_url: str, pool: ConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
     def assign_tool_to_agent(self, agent_id: str, tool_data: dict[str, Any]): ...
     def remove_tool_from_agent(self, agent_id: str, tool_data: dict[str, Any]): ...
     def get_tools(self, agent_id: str): ...
     def add_relationship(self, agent_id: str, data: dict[str, Any]): ...
     def get_relationships(self, agent_id: str): ...
     def remove_relationship(self, agent_id: str, related_agent_id: str): ...
+    def assign_tools(self, assignments: Iterable[tuple[str, dict[str, Any]]], max_workers: int = 8) -> list[BulkResult]: ...
+    def add_relationships(self, relationships: Iterable[tuple[str, dict[str, Any]]], max_workers: int = 8) -> list[BulkResult]: ...
 
 class FrameworkClient(BaseClient):
-    def __init__(self, base_url: str) -> None: ...
+    def __init__(self, base_url: str, pool: ConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
     def add_swarm_to_framework(self, framework_id: str, swarm_data: dict[str, Any]): ...
     def remove_swarm_from_framework(self, framework_id: str, swarm_data: dict[str, Any]): ...
     def add_tool_to_framework(self, framework_id: str, tool_data): ...
 
 class SwarmClient(BaseClient):
-    def __init__(self, base_url: str) -> None: ...
+    def __init__(self, base_url: str, pool: ConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
 
 class ToolClient(BaseClient):
-    def __init__(self, base_url: str) -> None: ...
+    def __init__(self, base_url: str, pool: ConnectionPool | None = None, cache: TTLCache | None = None, validator_cache: TTLCache | None = None, coalesce: bool = False) -> None: ...
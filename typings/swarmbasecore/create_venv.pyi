@@ -1,9 +1,20 @@
 from _typeshed import Incomplete
 from os import PathLike
 from pathlib import Path
+from typing import NamedTuple
 
 logger: Incomplete
+MANIFEST_FILE_NAME: str
 
 def create_virtualenv(env_dir: PathLike, requirements_file: Path | None = None): ...
 def create_directory(path: Path) -> None: ...
 def write_file(file_path: Path, content: str) -> None: ...
+
+class ExportSummary(NamedTuple):
+    written: list[Path]
+    skipped: list[Path]
+    removed: list[Path]
+
+def content_hash(content: str) -> str: ...
+def write_files(root: Path, files: dict[Path, str], incremental: bool = False, max_workers: int | None = None) -> ExportSummary: ...
+def write_files_atomically(root: Path, files: dict[Path, str], max_workers: int | None = None) -> ExportSummary: ...
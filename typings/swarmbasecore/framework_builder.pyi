@@ -1,9 +1,13 @@
 from .builders import Agent as Agent, Swarm as Swarm, Tool as Tool
-from .create_venv import create_directory as create_directory, create_virtualenv as create_virtualenv, write_file as write_file
+from .create_venv import ExportSummary as ExportSummary, create_virtualenv as create_virtualenv, write_files as write_files, write_files_atomically as write_files_atomically
 from .utils import snake_case as snake_case
 from pathlib import Path
 from typing import Protocol
 
+TOOL_CLASS_ATTRIBUTES: tuple[str, ...]
+AGENCY_ARGUMENTS: tuple[str, ...]
+AGENCY_POOL_ARGUMENTS: dict[str, str]
+
 class FrameworkCreator(Protocol):
     @classmethod
     def swarm_as_string(cls, swarm: Swarm) -> str: ...
@@ -12,7 +16,9 @@ class FrameworkCreator(Protocol):
     @classmethod
     def tool_as_string(tool: Tool) -> str: ...
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: ...
+    def swarm_files(cls, swarm: Swarm) -> dict[Path, str]: ...
+    @classmethod
+    def create_swarm_files(cls, swarm: Swarm, base_path: Path, incremental: bool = False, atomic: bool = False, max_workers: int | None = None) -> ExportSummary: ...
     @staticmethod
     def setup_virtualenv(swarm_name: str, requirements_file: Path | None) -> None: ...
 
@@ -24,7 +30,7 @@ class SwarmBaseCreator(FrameworkCreator):
     @staticmethod
     def tool_as_string(tool: Tool) -> str: ...
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: ...
+    def swarm_files(cls, swarm: Swarm) -> dict[Path, str]: ...
 
 class LangchainCreator(FrameworkCreator):
     @staticmethod
@@ -34,7 +40,7 @@ class LangchainCreator(FrameworkCreator):
     @classmethod
     def tool_as_string(cls, tool: Tool) -> str: ...
     @classmethod
-    def create_swarm_files(cls, swarm: Swarm, base_path: Path) -> None: ...
+    def swarm_files(cls, swarm: Swarm) -> dict[Path, str]: ...
 
 class CreatorFactory:
     @staticmethod
@@ -1 +1,29 @@
+import logging
+import queue
+from _typeshed import Incomplete
+
+FORMAT: str
+
+class HandlerRegistry:
+    max_open_files: Incomplete
+    def __init__(self, max_open_files: int = 64) -> None: ...
+    def file_handler(self, filename: str) -> logging.Handler: ...
+    def console_handler(self) -> logging.Handler: ...
+    def touch(self, handler: logging.Handler) -> None: ...
+    @property
+    def open_files(self) -> int: ...
+
+handler_registry: HandlerRegistry
+
+class BatchingQueueListener:
+    queue: Incomplete
+    batch_size: Incomplete
+    sinks: dict[str, list[logging.Handler]]
+    def __init__(self, log_queue: queue.SimpleQueue, batch_size: int = 100) -> None: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def handle_batch(self, records: list[logging.LogRecord]) -> None: ...
+
+def enable_queue_logging(batch_size: int = 100) -> None: ...
+def disable_queue_logging() -> None: ...
 def setup_logger(class_name: str, name: str | None = None): ...
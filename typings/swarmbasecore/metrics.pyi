@@ -0,0 +1,28 @@
+from _typeshed import Incomplete
+from typing import Sequence
+
+DEFAULT_BUCKETS: tuple[float, ...]
+MetricKey = tuple[str, str, str]
+
+class CallStats:
+    calls: int
+    errors: int
+    total_seconds: float
+    buckets: list[int]
+    def __init__(self, calls: int = 0, errors: int = 0, total_seconds: float = 0.0, buckets: list[int] = ...) -> None: ...
+    @property
+    def mean(self) -> float: ...
+
+class MetricsRegistry:
+    buckets: Incomplete
+    enabled: bool
+    def __init__(self, buckets: Sequence[float] = ..., enabled: bool = False) -> None: ...
+    def observe(self, kind: str, name: str, method: str, seconds: float, error: bool = False) -> None: ...
+    def snapshot(self) -> dict[MetricKey, CallStats]: ...
+    def reset(self) -> None: ...
+    def to_prometheus(self, prefix: str = 'swarmbase') -> str: ...
+
+metrics: MetricsRegistry
+
+def enable_metrics() -> None: ...
+def disable_metrics() -> None: ...
@@ -1 +1,3 @@
-from .utils import AgentRelationship as AgentRelationship, RelationshipType as RelationshipType, make_request as make_request, pascal_case as pascal_case, snake_case as snake_case
+from .cache import CacheInfo as CacheInfo, TTLCache as TTLCache
+from .singleflight import AsyncSingleFlight as AsyncSingleFlight, SingleFlight as SingleFlight
+from .utils import AgentRelationship as AgentRelationship, ConnectionPool as ConnectionPool, RelationshipType as RelationshipType, ValidatedResponse as ValidatedResponse, close_connection_pools as close_connection_pools, get_connection_pool as get_connection_pool, make_request as make_request, pascal_case as pascal_case, snake_case as snake_case
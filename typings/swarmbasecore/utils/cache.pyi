@@ -0,0 +1,23 @@
+from typing import Any, Callable, Hashable, NamedTuple
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+
+class TTLCache:
+    maxsize: int | None
+    ttl: float | None
+    hits: int
+    misses: int
+    generation: int
+    def __init__(self, maxsize: int | None = 128, ttl: float | None = None) -> None: ...
+    def lookup(self, key: Hashable) -> tuple[bool, Any]: ...
+    def get(self, key: Hashable, default: Any = None) -> Any: ...
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None: ...
+    def pop(self, key: Hashable) -> None: ...
+    def pop_matching(self, predicate: Callable[[Hashable], bool]) -> int: ...
+    def clear(self) -> None: ...
+    def info(self) -> CacheInfo: ...
+    def __len__(self) -> int: ...
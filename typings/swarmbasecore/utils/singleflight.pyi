@@ -0,0 +1,15 @@
+from typing import Any, Awaitable, Callable, Hashable
+
+class SingleFlight:
+    calls: int
+    shared: int
+    def __init__(self) -> None: ...
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any: ...
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None: ...
+
+class AsyncSingleFlight:
+    calls: int
+    shared: int
+    def __init__(self) -> None: ...
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any: ...
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None: ...
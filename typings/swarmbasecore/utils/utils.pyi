@@ -1,6 +1,8 @@
+import requests
 from _typeshed import Incomplete
 from enum import Enum
-from typing import NamedTuple
+from .cache import TTLCache as TTLCache
+from typing import Any, Hashable, Mapping, NamedTuple
 
 def snake_case(s): ...
 def pascal_case(s): ...
@@ -14,4 +16,24 @@ class AgentRelationship(NamedTuple):
     source_agent_id: str
     target_agent_id: str
 
-def make_request(method, url, headers: Incomplete | None = None, data: Incomplete | None = None, params: Incomplete | None = None): ...
+class ConnectionPool:
+    pool_connections: Incomplete
+    pool_maxsize: Incomplete
+    pool_block: Incomplete
+    max_retries: Incomplete
+    idle_timeout: Incomplete
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, max_retries: int = 0, idle_timeout: float | None = 60.0) -> None: ...
+    def request(self, method, url, **kwargs) -> requests.Response: ...
+    def close(self) -> None: ...
+
+def get_connection_pool(base_url: str, **pool_kwargs) -> ConnectionPool: ...
+def close_connection_pools() -> None: ...
+class ValidatedResponse(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    data: Any
+
+def validator_key(url: str, params: dict[str, Any] | None = None) -> Hashable: ...
+def conditional_headers(cached: ValidatedResponse) -> dict[str, str]: ...
+def validated_response(headers: Mapping[str, str], data: Any) -> ValidatedResponse | None: ...
+def make_request(method, url, headers: Incomplete | None = None, data: Incomplete | None = None, params: Incomplete | None = None, pool: ConnectionPool | None = None, validator_cache: TTLCache | None = None): ...